@@ -5,44 +5,223 @@ No external AI API needed.
 """
 
 import os
+import io
+import time
+import importlib.util
+import uuid
+import threading
 import PyPDF2
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from docx import Document
 
-from skill_scorer import score_skills, extract_skills_from_text, get_fallback_companies, calculate_company_eligibility
+from skill_scorer import (
+    score_skills, extract_skills_from_text, get_fallback_companies,
+    calculate_company_eligibility, SKILL_DB_VERSION, _normalize,
+)
 from job_scraper import search_jobs
 from ats_scorer import score_ats
+from disk_cache import DiskCache, content_hash
+from metrics import STAGE_SECONDS, ANALYSES_IN_FLIGHT, CACHE_REQUESTS
 
+# Resume parsing budgets: pages, characters and wall-clock seconds per PDF
+RESUME_MAX_PAGES = int(os.getenv("RESUME_MAX_PAGES", "10"))
+RESUME_MAX_CHARS = int(os.getenv("RESUME_MAX_CHARS", "60000"))
+RESUME_TIME_BUDGET = float(os.getenv("RESUME_TIME_BUDGET", "5"))
+PDF_BACKEND = os.getenv("PDF_BACKEND", "auto").lower()
 
-def extract_text_from_resume(filepath):
-    """Extract text from PDF or DOCX resume files."""
-    ext = os.path.splitext(filepath)[1].lower()
+# Content-addressed cache for extracted text and scores ("" disables it)
+ANALYSIS_CACHE_DIR = os.getenv("ANALYSIS_CACHE_DIR", os.path.join("cache", "analysis"))
+ANALYSIS_CACHE_MAX_MB = float(os.getenv("ANALYSIS_CACHE_MAX_MB", "200"))
+
+_cache = DiskCache(ANALYSIS_CACHE_DIR, int(ANALYSIS_CACHE_MAX_MB * 1024 * 1024)) if ANALYSIS_CACHE_DIR else None
+
+# Async analysis: worker pool size and how long finished analyses are kept
+ANALYSIS_WORKERS = int(os.getenv("ANALYSIS_WORKERS", "4"))
+ANALYSIS_TTL = float(os.getenv("ANALYSIS_TTL", "3600"))
+ANALYSIS_MAX_ENTRIES = int(os.getenv("ANALYSIS_MAX_ENTRIES", "1000"))
+
+
+# ── PDF Backends ────────────────────────────────────────────────────────────
+# Each backend yields page text one page at a time from the raw PDF bytes.
+
+def _pages_pypdf2(data):
+    reader = PyPDF2.PdfReader(io.BytesIO(data))
+    for page in reader.pages:
+        yield page.extract_text() or ""
+
+
+def _pages_pymupdf(data):
+    import pymupdf
+
+    with pymupdf.open(stream=data, filetype="pdf") as doc:
+        for page in doc:
+            yield page.get_text()
+
+
+def _pages_pypdfium2(data):
+    import pypdfium2
+
+    pdf = pypdfium2.PdfDocument(data)
+    try:
+        for i in range(len(pdf)):
+            page = pdf[i]
+            textpage = page.get_textpage()
+            try:
+                yield textpage.get_text_range()
+            finally:
+                textpage.close()
+                page.close()
+    finally:
+        pdf.close()
+
+
+def _pages_pdfplumber(data):
+    import pdfplumber
+
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        for page in pdf.pages:
+            yield page.extract_text() or ""
+            page.close()
+
+
+# name -> (module to probe, page iterator); "auto" picks the first installed
+PDF_BACKENDS = {
+    "pymupdf": ("pymupdf", _pages_pymupdf),
+    "pypdfium2": ("pypdfium2", _pages_pypdfium2),
+    "pypdf2": ("PyPDF2", _pages_pypdf2),
+    "pdfplumber": ("pdfplumber", _pages_pdfplumber),
+}
+
+
+def available_pdf_backends():
+    """Names of the PDF backends importable in this environment, fastest first."""
+    return [
+        name for name, (module, _) in PDF_BACKENDS.items()
+        if importlib.util.find_spec(module) is not None
+    ]
+
+
+def _resolve_pdf_backend(backend=None):
+    backend = (backend or PDF_BACKEND).lower()
+    if backend != "auto" and backend in available_pdf_backends():
+        return backend
+    if backend != "auto":
+        print(f"[Resume Parser] PDF backend '{backend}' unavailable, using auto")
+    available = available_pdf_backends()
+    return available[0] if available else "pypdf2"
+
+
+def iter_pdf_pages(data, backend=None, max_pages=RESUME_MAX_PAGES,
+                   max_chars=RESUME_MAX_CHARS, time_budget=RESUME_TIME_BUDGET):
+    """
+    Yield page text from PDF bytes, stopping at the page, character or
+    wall-clock budget. Budgets are checked between pages, so one slow page
+    can overrun the time budget but no further pages are parsed after it.
+    """
+    name = _resolve_pdf_backend(backend)
+    pages = PDF_BACKENDS[name][1](data)
+    deadline = time.monotonic() + time_budget
+    chars = 0
+
+    try:
+        for page_number, text in enumerate(pages, start=1):
+            remaining = max_chars - chars
+            if len(text) >= remaining:
+                yield text[:remaining]
+                print(f"[Resume Parser] Stopped at {max_chars} characters (page {page_number})")
+                return
+            chars += len(text)
+            yield text
+
+            if page_number >= max_pages:
+                print(f"[Resume Parser] Stopped at page limit ({max_pages})")
+                return
+            if time.monotonic() > deadline:
+                print(f"[Resume Parser] Stopped at {time_budget:g}s time budget (page {page_number})")
+                return
+    finally:
+        pages.close()
+
+
+RESUME_EXTENSIONS = (".pdf", ".doc", ".docx")
+
+
+def extract_text_from_resume(filepath, backend=None):
+    """
+    Extract text from PDF or DOCX resume files.
+    Results are cached by a hash of the file bytes.
+    """
+    if not filepath.lower().endswith(RESUME_EXTENSIONS):
+        return ""
+
+    try:
+        with open(filepath, "rb") as f:
+            data = f.read()
+    except OSError as e:
+        print(f"[Resume Parser] File read error: {e}")
+        return ""
+
+    return extract_text_from_bytes(data, filepath, backend)
+
+
+def extract_text_from_bytes(data, filename, backend=None):
+    """
+    Extract text from an in-memory PDF or DOCX resume (e.g. an upload).
+    The filename only selects the parser by extension.
+    """
+    ext = os.path.splitext(filename)[1].lower()
+    if ext not in RESUME_EXTENSIONS:
+        return ""
+
+    with STAGE_SECONDS.time("resume", "extract"):
+        return _extract_text(data, ext, backend)
+
+
+def _extract_text(data, ext, backend=None):
+    parser = _resolve_pdf_backend(backend) if ext == ".pdf" else "docx"
+    key = ["text", content_hash(data), parser]
+    cached = _cache_get(key, "text")
+    if cached is not None:
+        return cached
 
     if ext == ".pdf":
         try:
-            with open(filepath, "rb") as f:
-                reader = PyPDF2.PdfReader(f)
-                text = "\n".join(
-                    page.extract_text() or "" for page in reader.pages
-                )
-            return text.strip()
+            text = "\n".join(iter_pdf_pages(data, parser)).strip()
         except Exception as e:
             print(f"[Resume Parser] PDF read error: {e}")
             return ""
-
-    elif ext in (".doc", ".docx"):
+    else:
         try:
-            doc = Document(filepath)
-            return "\n".join(para.text for para in doc.paragraphs).strip()
+            doc = Document(io.BytesIO(data))
+            text = "\n".join(para.text for para in doc.paragraphs).strip()
         except Exception as e:
             print(f"[Resume Parser] DOCX read error: {e}")
             return ""
 
-    return ""
+    if text:
+        _cache_set(key, text)
+    return text
+
+
+def _cache_get(key, name):
+    """Look up key in the analysis cache, counting the hit or miss under name."""
+    if _cache is None:
+        return None
+    value = _cache.get(key)
+    CACHE_REQUESTS.inc(name, "miss" if value is None else "hit")
+    return value
+
 
+def _cache_set(key, value):
+    if _cache is not None:
+        _cache.set(key, value)
 
-def analyze_resume(resume_text, target_role=""):
+
+def analyze_resume(resume_text, target_role="", fetch_jobs=True):
     """
     Analyze a resume using local skill scoring + live job scraping.
+    With fetch_jobs=False, skips scraping and uses fallback companies.
 
     Returns dict with: score, matched_skills, missing_skills, companies,
                        suggestions, ai_summary, target_role, skill_breakdown, jobs
@@ -65,35 +244,68 @@ def analyze_resume(resume_text, target_role=""):
             "ats_summary": {"passed": 0, "warnings": 0, "failed": 0},
         }
 
-    extracted_skills = extract_skills_from_text(resume_text)
-    skills_string = ", ".join(extracted_skills)
-
-    result = score_skills(skills_string, target_role)
-    jobs = _fetch_jobs(extracted_skills, result["target_role"], score=result["score"])
-
-    # ATS scoring (only for resume uploads)
-    ats_result = score_ats(resume_text, result["target_role"])
-    result["ats_score"] = ats_result["ats_score"]
-    result["ats_grade"] = ats_result["ats_grade"]
-    result["ats_criteria"] = ats_result["criteria"]
-    result["ats_tips"] = ats_result["ats_tips"]
-    result["ats_summary"] = ats_result["summary"]
-
-    return _build_result(result, jobs)
+    with ANALYSES_IN_FLIGHT.track("resume"):
+        extracted_skills, result = _stage_skills(resume_text, target_role)
+        _stage_ats(result, resume_text)
+        return _stage_jobs(result, extracted_skills, fetch_jobs)
 
 
-def analyze_profile(name, target_role, skills, education):
+def analyze_profile(name, target_role, skills, education, fetch_jobs=True):
     """
     Analyze a manually entered profile using local scoring + job scraping.
+    With fetch_jobs=False, skips scraping and uses fallback companies.
 
     Returns dict with: score, matched_skills, missing_skills, companies,
                        suggestions, ai_summary, target_role, skill_breakdown, jobs
     """
-    result = score_skills(skills, target_role)
-    skills_list = [s.strip() for s in skills.split(",") if s.strip()]
-    jobs = _fetch_jobs(skills_list, result["target_role"], score=result["score"])
+    with ANALYSES_IN_FLIGHT.track("profile"):
+        with STAGE_SECONDS.time("profile", "skills"):
+            result = score_skills(skills, target_role)
+        skills_list = [s.strip() for s in skills.split(",") if s.strip()]
+        with STAGE_SECONDS.time("profile", "jobs"):
+            jobs = _fetch_jobs(skills_list, result["target_role"], score=result["score"]) if fetch_jobs else []
+
+        return _build_result(result, jobs)
+
+
+def _stage_skills(resume_text, target_role=""):
+    """Stage 1: extract skills from the resume and score them (cached)."""
+    with STAGE_SECONDS.time("resume", "skills"):
+        key = ["skills", content_hash(resume_text), _normalize(target_role), SKILL_DB_VERSION]
+        cached = _cache_get(key, "skills")
+        if cached is not None:
+            return cached["extracted"], cached["result"]
+
+        extracted_skills = extract_skills_from_text(resume_text)
+        skills_string = ", ".join(extracted_skills)
+        result = score_skills(skills_string, target_role)
+
+        _cache_set(key, {"extracted": extracted_skills, "result": result})
+        return extracted_skills, result
+
+
+def _stage_ats(result, resume_text):
+    """Stage 2: ATS scoring (only for resume uploads), merged into result (cached)."""
+    with STAGE_SECONDS.time("resume", "ats"):
+        key = ["ats", content_hash(resume_text), result["target_role"], SKILL_DB_VERSION]
+        ats_result = _cache_get(key, "ats")
+        if ats_result is None:
+            ats_result = score_ats(resume_text, result["target_role"])
+            _cache_set(key, ats_result)
+
+    result["ats_score"] = ats_result["ats_score"]
+    result["ats_grade"] = ats_result["ats_grade"]
+    result["ats_criteria"] = ats_result["criteria"]
+    result["ats_tips"] = ats_result["ats_tips"]
+    result["ats_summary"] = ats_result["summary"]
+    return result
+
 
-    return _build_result(result, jobs)
+def _stage_jobs(result, skills, fetch_jobs=True):
+    """Stage 3: live job search, then attach jobs and companies."""
+    with STAGE_SECONDS.time("resume", "jobs"):
+        jobs = _fetch_jobs(skills, result["target_role"], score=result["score"]) if fetch_jobs else []
+        return _build_result(result, jobs)
 
 
 def _build_result(result, jobs):
@@ -131,3 +343,96 @@ def _fetch_jobs(skills, target_role, max_results=5, score=50):
     except Exception as e:
         print(f"[AI Analyzer] Job scraping failed: {e}")
         return []
+
+
+
+# ── Async Analysis (submit / poll) ──────────────────────────────────────────
+
+_ANALYSIS_POOL = ThreadPoolExecutor(max_workers=ANALYSIS_WORKERS, thread_name_prefix="analysis")
+_analyses = OrderedDict()
+_analyses_lock = threading.Lock()
+
+
+def submit_resume_analysis(data, filename, target_role=""):
+    """
+    Queue an uploaded resume (raw bytes plus its filename) for analysis on
+    the worker pool.
+
+    Returns the analysis ID to poll with get_analysis().
+    """
+    analysis_id = uuid.uuid4().hex
+    record = {
+        "id": analysis_id,
+        "status": "queued",
+        "stages": [],
+        "result": {},
+        "error": "",
+        "created": time.time(),
+    }
+    with _analyses_lock:
+        _expire_analyses()
+        _analyses[analysis_id] = record
+
+    _ANALYSIS_POOL.submit(_run_resume_analysis, analysis_id, data, filename, target_role)
+    return analysis_id
+
+
+def get_analysis(analysis_id):
+    """Snapshot of an analysis (partial while running), or None if unknown."""
+    with _analyses_lock:
+        record = _analyses.get(analysis_id)
+        if record is None:
+            return None
+        snapshot = dict(record)
+        snapshot["stages"] = list(record["stages"])
+        snapshot["result"] = dict(record["result"])
+        return snapshot
+
+
+def _expire_analyses():
+    """Drop expired and overflow records. Caller holds _analyses_lock."""
+    cutoff = time.time() - ANALYSIS_TTL
+    while _analyses:
+        oldest = next(iter(_analyses.values()))
+        if oldest["created"] >= cutoff and len(_analyses) < ANALYSIS_MAX_ENTRIES:
+            break
+        _analyses.popitem(last=False)
+
+
+def _publish(analysis_id, stage, result=None, **fields):
+    """Record a finished stage and expose the result produced so far."""
+    with _analyses_lock:
+        record = _analyses.get(analysis_id)
+        if record is None:
+            return
+        if stage:
+            record["stages"].append(stage)
+        if result is not None:
+            record["result"] = dict(result)
+        record.update(fields)
+
+
+def _run_resume_analysis(analysis_id, data, filename, target_role):
+    """Worker: extract -> skills -> ats -> jobs, publishing after each stage."""
+    with ANALYSES_IN_FLIGHT.track("resume"):
+        try:
+            _publish(analysis_id, None, status="running")
+
+            resume_text = extract_text_from_bytes(data, filename)
+            _publish(analysis_id, "extract")
+            if not resume_text:
+                _publish(analysis_id, None, result=analyze_resume(""), status="error",
+                         error="Could not extract text from the file.")
+                return
+
+            extracted_skills, result = _stage_skills(resume_text, target_role)
+            _publish(analysis_id, "skills", result=result)
+
+            _stage_ats(result, resume_text)
+            _publish(analysis_id, "ats", result=result)
+
+            result = _stage_jobs(result, extracted_skills)
+            _publish(analysis_id, "jobs", result=result, status="done")
+        except Exception as e:
+            print(f"[AI Analyzer] Async analysis {analysis_id} failed: {e}")
+            _publish(analysis_id, None, status="error", error=str(e))
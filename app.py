@@ -1,21 +1,180 @@
 import os
-from flask import Flask, render_template, request, redirect, url_for, flash, jsonify, session
-from werkzeug.utils import secure_filename
-from ai_analyzer import analyze_profile, analyze_resume, extract_text_from_resume
+import json
+import time
+import hashlib
+import tempfile
+import threading
+from collections import OrderedDict
+from functools import lru_cache
+from markupsafe import Markup
+from flask import Flask, Request, Response, g, render_template, request, redirect, url_for, flash, jsonify, session
+from ai_analyzer import (
+    analyze_profile, analyze_resume, extract_text_from_bytes,
+    submit_resume_analysis, get_analysis,
+)
+from job_prefetch import start_prefetcher
+import metrics
+from request_profiler import PROFILER, PROFILE_HEADER, PROFILE_THRESHOLD_MS
+from result_store import RESULT_STORE
+from roadmap_service import ROADMAP_CACHE_SIZE, get_roadmap, precompute_roadmaps, roadmap_key
 
 # Config
-app = Flask(__name__)
-app.secret_key = "supersecretkey"
-
-UPLOAD_FOLDER = "uploads"
 ALLOWED_EXTENSIONS = {"pdf", "doc", "docx"}
 MAX_FILE_SIZE = 5 * 1024 * 1024  # 5MB
 
-app.config["UPLOAD_FOLDER"] = UPLOAD_FOLDER
+# Uploads up to this size stay in memory; larger ones spill to an anonymous
+# temp file that is removed when the request closes it
+UPLOAD_SPOOL_MAX = int(os.getenv("UPLOAD_SPOOL_MAX", str(MAX_FILE_SIZE)))
+
+ROADMAP_PRECOMPUTE = os.getenv("ROADMAP_PRECOMPUTE", "1").lower() not in ("0", "false", "no", "")
+
+# Rendered pages kept for identical template + context (0 disables the cache)
+RENDER_CACHE_SIZE = int(os.getenv("RENDER_CACHE_SIZE", "256"))
+RENDER_CACHE_MAX_BYTES = int(os.getenv("RENDER_CACHE_MAX_BYTES", str(32 * 1024 * 1024)))
+
+
+class SpooledUploadRequest(Request):
+    """Request whose file uploads are buffered in memory up to UPLOAD_SPOOL_MAX."""
+
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        return tempfile.SpooledTemporaryFile(max_size=UPLOAD_SPOOL_MAX, mode="rb+", prefix="carrieriq-upload-")
+
+
+class RenderCache:
+    """
+    Thread-safe LRU of rendered HTML keyed by render_key(), bounded by both
+    entry count and total size in bytes.
+    """
+
+    def __init__(self, max_entries=RENDER_CACHE_SIZE, max_bytes=RENDER_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            html = self._entries.get(key)
+            if html is not None:
+                self._entries.move_to_end(key)
+            return html
+
+    def put(self, key, html):
+        size = len(html)
+        if self.max_entries <= 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= len(old)
+            self._entries[key] = html
+            self._bytes += size
+            while len(self._entries) > self.max_entries or self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= len(evicted)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+app = Flask(__name__)
+app.secret_key = "supersecretkey"
+app.request_class = SpooledUploadRequest
+
 app.config["MAX_CONTENT_LENGTH"] = MAX_FILE_SIZE
 
-if not os.path.exists(UPLOAD_FOLDER):
-    os.makedirs(UPLOAD_FOLDER)
+# Optional background job-cache warming (set JOB_PREFETCH=1)
+prefetcher = start_prefetcher()
+
+
+# Full-page render cache with ETag revalidation
+
+def _templates_version():
+    """Digest of every template file, so a deploy with new templates changes every ETag."""
+    digest = hashlib.sha256()
+    for name in sorted(app.jinja_loader.list_templates()):
+        source = app.jinja_loader.get_source(app.jinja_env, name)[0]
+        digest.update(name.encode() + b"\0" + source.encode("utf-8") + b"\0")
+    return digest.hexdigest()
+
+
+TEMPLATES_VERSION = _templates_version()
+RENDER_CACHE = RenderCache()
+
+
+def render_key(template, context):
+    """Hash of the template name and its context, canonicalized as sorted-key JSON."""
+    canonical = json.dumps(context, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(f"{TEMPLATES_VERSION}\0{template}\0{canonical}".encode("utf-8")).hexdigest()
+
+
+def render_cached(template, **context):
+    """
+    render_template() for templates whose output depends only on their
+    context. GET requests whose If-None-Match carries the page's ETag get a
+    304 without rendering; otherwise identical renders come from RENDER_CACHE.
+    """
+    key = render_key(template, context)
+    etag = key[:32]
+    if request.method in ("GET", "HEAD") and request.if_none_match.contains(etag):
+        metrics.CACHE_REQUESTS.inc("render", "not_modified")
+        response = Response(status=304)
+    else:
+        html = RENDER_CACHE.get(key)
+        metrics.CACHE_REQUESTS.inc("render", "miss" if html is None else "hit")
+        if html is None:
+            html = render_template(template, **context)
+            RENDER_CACHE.put(key, html)
+        response = Response(html, content_type="text/html; charset=utf-8")
+
+    response.set_etag(etag)
+    # Personal pages: browsers may keep them but must revalidate each time
+    response.headers["Cache-Control"] = "private, no-cache"
+    return response
+
+
+# Slow-request profiling (set REQUEST_PROFILER=1)
+
+@app.before_request
+def _start_profile():
+    if PROFILER is not None:
+        g.profile = PROFILER.start()
+
+
+@app.teardown_request
+def _finish_profile(error=None):
+    profile = g.pop("profile", None)
+    if profile is None:
+        return
+    PROFILER.stop(profile)
+    elapsed_ms = (time.perf_counter() - profile.started) * 1000
+    if elapsed_ms < PROFILE_THRESHOLD_MS and not request.headers.get(PROFILE_HEADER):
+        return
+
+    # Never parse the body here (an oversized upload would re-raise 413);
+    # views that know the role or resume size attach it via _tag_profile
+    try:
+        tags = {
+            "route": request.url_rule.rule if request.url_rule else request.path,
+            "method": request.method,
+            "role": (request.view_args or {}).get("role", ""),
+            "resume_bytes": 0,
+            "error": repr(error) if error else "",
+        }
+        tags.update(profile.tags)
+        PROFILER.save(profile, elapsed_ms, **tags)
+    except Exception as e:
+        print(f"[Profiler] Could not save profile: {e}")
+
+
+def _tag_profile(**tags):
+    """Attach tags (e.g. resume size, resolved role) to the request's profile."""
+    profile = g.get("profile")
+    if profile is not None:
+        profile.tags.update(tags)
 
 
 def allowed_file(filename):
@@ -43,17 +202,17 @@ def upload():
             return redirect(request.url)
 
         if file and allowed_file(file.filename):
-            filename = secure_filename(file.filename)
-            filepath = os.path.join(app.config["UPLOAD_FOLDER"], filename)
-            file.save(filepath)
+            data = _read_upload(file)
 
-            resume_text = extract_text_from_resume(filepath)
+            resume_text = extract_text_from_bytes(data, file.filename)
+            _tag_profile(resume_bytes=len(data), resume_chars=len(resume_text))
 
             if not resume_text:
                 flash("Could not extract text from the file. Please try a different file.")
                 return redirect(request.url)
 
             result = analyze_resume(resume_text)
+            _tag_profile(role=result["target_role"])
             return _render_results(result)
 
         else:
@@ -72,6 +231,7 @@ def fill_manual():
         education = request.form.get("education", "").strip()
 
         result = analyze_profile(name, target_role, skills_input, education)
+        _tag_profile(role=result["target_role"])
         return _render_results(result)
 
     return render_template("fill_manual.html")
@@ -94,11 +254,66 @@ def api_jobs():
     return jsonify({"jobs": jobs})
 
 
+@app.route("/api/analysis", methods=["POST"])
+def api_submit_analysis():
+    """Queue a resume upload for background analysis; poll the returned URL."""
+    file = request.files.get("resume")
+    if not file or file.filename == "":
+        return jsonify({"error": "Please upload a resume file"}), 400
+    if not allowed_file(file.filename):
+        return jsonify({"error": "Invalid file type. Only PDF, DOC, DOCX allowed."}), 400
+
+    data = _read_upload(file)
+    target_role = request.form.get("target_role", "").strip()
+    _tag_profile(resume_bytes=len(data), role=target_role)
+    analysis_id = submit_resume_analysis(data, file.filename, target_role)
+
+    return jsonify({
+        "id": analysis_id,
+        "status": "queued",
+        "status_url": url_for("api_get_analysis", analysis_id=analysis_id),
+    }), 202
+
+
+@app.route("/api/analysis/<analysis_id>")
+def api_get_analysis(analysis_id):
+    """Return analysis status and the partial result published so far."""
+    analysis = get_analysis(analysis_id)
+    if analysis is None:
+        return jsonify({"error": "Unknown or expired analysis ID"}), 404
+    return jsonify(analysis)
+
+
+@app.route("/api/prefetch/status")
+def api_prefetch_status():
+    """Freshness and counters for the background job prefetcher."""
+    return jsonify(prefetcher.status())
+
+
+@app.route("/api/http/stats")
+def api_http_stats():
+    """Connection-pool reuse counters for the job source HTTP client."""
+    from job_scraper import http_pool_stats
+
+    return jsonify(http_pool_stats())
+
+
+@app.route("/api/jobs/sources")
+def api_job_sources():
+    """Per-source limits, circuit breaker state, error rate and timeouts."""
+    from job_scraper import source_status
+
+    return jsonify(source_status())
+
+
+@app.route("/metrics")
+def metrics_endpoint():
+    """Stage latencies, cache and job source counters in Prometheus text format."""
+    return Response(metrics.render(), content_type=metrics.CONTENT_TYPE)
+
+
 @app.route("/roadmap/<role>/<int:score>")
 def roadmap(role, score):
-    from skill_scorer import ROLE_SKILLS
-    from learning_resources import build_learning_roadmap
-
     role_lower = role.lower()
 
     # Read missing skills from query params (passed from results page)
@@ -106,29 +321,39 @@ def roadmap(role, score):
     missing_important = [s.strip() for s in request.args.get("important", "").split(",") if s.strip()]
     missing_nice = [s.strip() for s in request.args.get("nice", "").split(",") if s.strip()]
 
-    # If no missing skills provided, derive from role database
-    if not missing_core and not missing_important and not missing_nice:
-        if role_lower in ROLE_SKILLS:
-            role_data = ROLE_SKILLS[role_lower]
-            missing_core = [s.title() for s in role_data["core"]]
-            missing_important = [s.title() for s in role_data["important"]]
-            missing_nice = [s.title() for s in role_data["nice"]]
-
-    # Build the personalized learning roadmap with resources
-    phases = build_learning_roadmap(missing_core, missing_important, missing_nice)
+    # Identical skill gaps share one memoized roadmap and rendered timeline;
+    # with none provided the key covers everything in the role database
+    key = roadmap_key(role_lower, missing_core, missing_important, missing_nice)
 
     # Also keep project suggestions
     projects = _get_project_suggestions(role_lower)
 
-    return render_template(
+    return render_cached(
         "roadmap.html",
         role=role.title(),
         score=score,
-        phases=phases,
+        phases_html=_roadmap_phases_html(key),
         projects=projects,
     )
 
 
+@lru_cache(maxsize=ROADMAP_CACHE_SIZE)
+def _roadmap_phases_html(key):
+    """Rendered roadmap timeline for a roadmap_key(), shared across requests."""
+    return Markup(render_template("_roadmap_phases.html", phases=get_roadmap(key)))
+
+
+def _precompute_roadmaps():
+    with app.app_context():
+        count = precompute_roadmaps(render=_roadmap_phases_html)
+    print(f"[Roadmap] Precomputed roadmaps for {count} roles")
+
+
+# Warm every role's full roadmap in the background (set ROADMAP_PRECOMPUTE=0 to skip)
+if ROADMAP_PRECOMPUTE:
+    threading.Thread(target=_precompute_roadmaps, name="roadmap-precompute", daemon=True).start()
+
+
 @app.route("/career-finder", methods=["GET", "POST"])
 def career_finder():
     """Find best matching career roles for user skills."""
@@ -140,7 +365,7 @@ def career_finder():
 
         roles = find_best_roles(skills_input)
 
-        return render_template(
+        return render_cached(
             "career_finder.html",
             roles=roles,
             skills_input=skills_input,
@@ -148,14 +373,15 @@ def career_finder():
             total_roles=len(ROLE_SKILLS),
         )
 
-    return render_template("career_finder.html", roles=None)
+    return render_cached("career_finder.html", roles=None)
 
 
 @app.route("/ats")
-def ats_page():
-    """Render the dedicated ATS analysis page from session data."""
-    ats_data = session.get("ats_data", {})
-    if not ats_data:
+@app.route("/ats/<analysis_id>")
+def ats_page(analysis_id=None):
+    """Render the dedicated ATS analysis page from the stored analysis result."""
+    ats_data = RESULT_STORE.get(analysis_id or session.get("analysis_id"))
+    if not ats_data or ats_data.get("ats_score") is None:
         flash("No ATS data available. Please upload a resume first.")
         return redirect(url_for("upload"))
     return render_template(
@@ -170,19 +396,24 @@ def ats_page():
 
 # Helpers
 
+def _read_upload(file):
+    """Read an uploaded resume into memory and close its spool (and any spill file)."""
+    try:
+        return file.read()
+    finally:
+        file.close()
+
+
 def _render_results(result):
     """Render the results template from an analysis result dict."""
-    # Store ATS data in session for the dedicated ATS page
+    # Keep the result server-side; the session cookie only carries its ID
+    session.pop("ats_data", None)  # payload stored by older versions
+    analysis_id = None
     if result.get("ats_score") is not None:
-        session["ats_data"] = {
-            "ats_score": result.get("ats_score"),
-            "ats_grade": result.get("ats_grade", ""),
-            "ats_criteria": result.get("ats_criteria", []),
-            "ats_tips": result.get("ats_tips", []),
-            "ats_summary": result.get("ats_summary", {}),
-        }
+        analysis_id = RESULT_STORE.put(result)
+        session["analysis_id"] = analysis_id
 
-    return render_template(
+    return render_cached(
         "results.html",
         score=result["score"],
         matched_skills=result["matched_skills"],
@@ -197,6 +428,7 @@ def _render_results(result):
         ats_criteria=result.get("ats_criteria", []),
         ats_tips=result.get("ats_tips", []),
         ats_summary=result.get("ats_summary", {}),
+        analysis_id=analysis_id,
     )
 
 
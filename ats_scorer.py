@@ -5,7 +5,8 @@ Returns a numeric score, letter grade, per-criterion breakdown, and prioritised
 """
 
 import re
-from skill_scorer import ROLE_SKILLS, _normalize, _fuzzy_match
+from collections import Counter
+from skill_scorer import ROLE_SKILLS, _normalize, _match_role_name
 
 
 # ── Reference Data ──────────────────────────────────────────────────────────
@@ -42,6 +43,55 @@ BAD_PATTERNS = [
     r"\.{5,}",
 ]
 
+DEGREES = [
+    "b.tech", "btech", "b.e", "b.sc", "bsc", "m.tech", "mtech", "m.sc", "msc",
+    "m.s.", "b.s.", "bachelor", "master", "mba", "phd", "ph.d", "diploma",
+    "associate", "b.a.", "m.a.", "b.com", "m.com", "bca", "mca",
+]
+
+# ── Compiled Pattern Bank ───────────────────────────────────────────────────
+# Compiled once at import. BAD_PATTERNS are folded into one pattern: every
+# glyph counts on its own, and each maximal run of a divider character
+# counts once if it reaches the run length its BAD_PATTERNS entry requires.
+
+_FORMATTING_GLYPHS = "│┤├┬┴┼╔╗╚╝═║" "\u2022\u2023\u25E6\u2043\u2219" "★☆●○◆◇▶►"
+_FORMATTING_RUNS = {"|": 2, "_": 5, "=": 5, "-": 5, ".": 5}
+_FORMATTING_RE = re.compile(
+    r"(?P<char>[" + re.escape(_FORMATTING_GLYPHS + "".join(_FORMATTING_RUNS)) + r"])(?P<run>(?P=char)*)"
+)
+
+_EMAIL_RE = re.compile(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}")
+_PHONE_RE = re.compile(r"[\+]?[\d\s\-\(\)]{7,15}")
+_LINKEDIN_RE = re.compile(r"linkedin\.com|linkedin", re.IGNORECASE)
+_PORTFOLIO_RE = re.compile(r"github\.com|portfolio|website", re.IGNORECASE)
+
+# Patterns below lead with a character class (instead of \b or an
+# alternation) so the regex engine can skip ahead to candidate positions.
+# Each matches exactly what the commented original matched.
+
+# \d+[%xX] | \$[\d,]+[KkMm]? | \d{2,}\+ | \d+\s*(?:users|...|reduction)
+_METRIC_RE = re.compile(
+    r"[\d$](?:(?<=\d)(?:\d*[%xX]|\d+\+|\d*\s*(?:users|customers|clients|projects|team|members|revenue|sales|increase|decrease|growth|reduction))|(?<=\$)[\d,]+[KkMm]?)",
+    re.IGNORECASE,
+)
+# \b\d{2,}\b
+_NUMBER_RE = re.compile(r"\d(?<!\w\d)\d+\b")
+
+_DEGREE_RE = re.compile("|".join(re.escape(d) for d in DEGREES))
+_INSTITUTION_RE = re.compile(r"university|college|institute|iit|nit|iiit|school")
+_YEAR_RE = re.compile(r"20[0-3]\d|19[89]\d")
+_GRADE_RE = re.compile(r"gpa|cgpa|percentage|grade|first class|distinction")
+
+# \b\d{4}\s*[-–]\s*\d{4}\b
+_DASH_DATE_RE = re.compile(r"\d(?<!\w\d)\d{3}\s*[-–]\s*\d{4}\b")
+_SLASH_DATE_RE = re.compile(r"\b\d{1,2}/\d{4}\b")
+_MONTH_DATE_RE = re.compile(r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\b", re.IGNORECASE)
+# \b\w+ed\b (one match per word of 3+ characters ending in "ed")
+_PAST_TENSE_RE = re.compile(r"ed\b(?<=\wed)")
+_PRESENT_TENSE_RE = re.compile(r"\b(?:manage|develop|create|build|lead|design|implement|maintain|optimize|deploy)s?\b", re.IGNORECASE)
+
+_NOISE_RE = re.compile(r"page\s+\d+\s+of\s+\d+|confidential|all rights reserved", re.IGNORECASE)
+
 # ── Grade Mapping ───────────────────────────────────────────────────────────
 
 def _get_grade(score):
@@ -56,6 +106,38 @@ def _get_grade(score):
     return "F"
 
 
+# ── Document Model ──────────────────────────────────────────────────────────
+
+_HEADER_PREFIXES = tuple(SECTION_HEADERS)
+_SPECIAL_BULLETS = "•◦▪"
+
+
+class ResumeDocument:
+    """
+    Single tokenization pass over a resume, shared by every criterion check.
+
+    Attributes:
+        text, text_lower    – original and lowercased text
+        lines               – text.strip() split on newlines
+        stripped_lines      – each line with surrounding whitespace removed
+        header_candidates   – stripped, lowercased lines without a trailing ":"
+        tokens, word_count  – whitespace tokens and their number
+        line_lengths        – Counter of stripped line lengths
+        bullet_prefixes     – Counter of the first character of non-empty lines
+    """
+
+    def __init__(self, text):
+        self.text = text
+        self.text_lower = text.lower()
+        self.lines = text.strip().split("\n")
+        self.stripped_lines = [line.strip() for line in self.lines]
+        self.header_candidates = [line.lower().rstrip(":") for line in self.stripped_lines]
+        self.tokens = text.split()
+        self.word_count = len(self.tokens)
+        self.line_lengths = Counter(len(line) for line in self.stripped_lines)
+        self.bullet_prefixes = Counter(line[0] for line in self.stripped_lines if line)
+
+
 # ── Main Entry Point ────────────────────────────────────────────────────────
 
 def score_ats(resume_text, target_role=""):
@@ -83,23 +165,20 @@ def score_ats(resume_text, target_role=""):
             "summary": {"passed": 0, "warnings": 0, "failed": 0},
         }
 
-    text_lower = resume_text.lower()
-    lines = resume_text.strip().split("\n")
-    words = resume_text.split()
-    word_count = len(words)
+    doc = ResumeDocument(resume_text)
 
     # Ordered list: (checker_function, weight)
     checks = [
-        (_check_contact_info(resume_text),              10),
-        (_check_section_headers(text_lower, lines),     15),
-        (_check_quantifiable(resume_text),              12),
-        (_check_action_verbs(text_lower),               10),
-        (_check_length(word_count),                      8),
-        (_check_keywords(text_lower, target_role),      20),
-        (_check_formatting(resume_text),                 8),
-        (_check_education(text_lower),                   7),
-        (_check_consistency(resume_text, lines),         5),
-        (_check_parsability(lines, word_count),          5),
+        (_check_contact_info(doc),                  10),
+        (_check_section_headers(doc),               15),
+        (_check_quantifiable(doc),                  12),
+        (_check_action_verbs(doc),                  10),
+        (_check_length(doc),                         8),
+        (_check_keywords(doc, target_role),         20),
+        (_check_formatting(doc),                     8),
+        (_check_education(doc),                      7),
+        (_check_consistency(doc),                    5),
+        (_check_parsability(doc),                    5),
     ]
 
     criteria = []
@@ -144,31 +223,32 @@ def _status(score):
     return "bad"
 
 
-def _check_contact_info(text):
+def _check_contact_info(doc):
     """Check for email, phone, and LinkedIn."""
+    text = doc.text
     found = 0
     details = []
 
-    if re.search(r"[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}", text):
+    if _EMAIL_RE.search(text):
         found += 1
         details.append("Email found")
     else:
         details.append("Email missing")
 
-    if re.search(r"[\+]?[\d\s\-\(\)]{7,15}", text):
+    if _PHONE_RE.search(text):
         found += 1
         details.append("Phone found")
     else:
         details.append("Phone missing")
 
-    if re.search(r"linkedin\.com|linkedin", text, re.IGNORECASE):
+    if _LINKEDIN_RE.search(text):
         found += 1
         details.append("LinkedIn found")
     else:
         details.append("LinkedIn missing")
 
     # GitHub / Portfolio bonus
-    if re.search(r"github\.com|portfolio|website", text, re.IGNORECASE):
+    if _PORTFOLIO_RE.search(text):
         found += 0.5
         details.append("Portfolio/GitHub found")
 
@@ -186,11 +266,13 @@ def _check_contact_info(text):
     }
 
 
-def _check_section_headers(text_lower, lines):
+def _check_section_headers(doc):
     """Check for standard resume section headers."""
     found_sections = []
-    for line in lines:
-        line_clean = line.strip().lower().rstrip(":")
+    for line_clean in doc.header_candidates:
+        # Equality implies a prefix match, so one C-level check rejects most lines
+        if not line_clean.startswith(_HEADER_PREFIXES):
+            continue
         for header in SECTION_HEADERS:
             if line_clean == header or line_clean.startswith(header):
                 if header not in found_sections:
@@ -220,13 +302,10 @@ def _check_section_headers(text_lower, lines):
     }
 
 
-def _check_quantifiable(text):
+def _check_quantifiable(doc):
     """Check for numbers, percentages, and metrics."""
-    metrics = re.findall(
-        r"\d+[%xX]|\$[\d,]+[KkMm]?|\d{2,}[\+]|\d+\s*(?:users|customers|clients|projects|team|members|revenue|sales|increase|decrease|growth|reduction)",
-        text, re.IGNORECASE,
-    )
-    numbers = re.findall(r"\b\d{2,}\b", text)
+    metrics = _METRIC_RE.findall(doc.text)
+    numbers = _NUMBER_RE.findall(doc.text)
 
     metric_count = len(metrics)
     number_count = min(len(numbers), 10)
@@ -245,9 +324,9 @@ def _check_quantifiable(text):
     }
 
 
-def _check_action_verbs(text_lower):
+def _check_action_verbs(doc):
     """Check for strong action verbs."""
-    found_verbs = [v for v in ACTION_VERBS if v in text_lower]
+    found_verbs = [v for v in ACTION_VERBS if v in doc.text_lower]
     count = len(found_verbs)
     score = min(100, count * 14)
     status = _status(score)
@@ -268,8 +347,9 @@ def _check_action_verbs(text_lower):
     }
 
 
-def _check_length(word_count):
+def _check_length(doc):
     """Check if resume length is optimal."""
+    word_count = doc.word_count
     if 300 <= word_count <= 800:
         score, detail = 100, f"{word_count} words — optimal length"
     elif 200 <= word_count < 300:
@@ -296,15 +376,13 @@ def _check_length(word_count):
     }
 
 
-def _check_keywords(text_lower, target_role):
+def _check_keywords(doc, target_role):
     """Check density of role-relevant keywords."""
+    text_lower = doc.text_lower
     role_key = _normalize(target_role) if target_role else ""
 
     if role_key not in ROLE_SKILLS:
-        for r in ROLE_SKILLS:
-            if _fuzzy_match(role_key, r, threshold=0.6):
-                role_key = r
-                break
+        role_key = _match_role_name(role_key) or role_key
 
     if not role_key or role_key not in ROLE_SKILLS:
         return {
@@ -349,11 +427,16 @@ def _check_keywords(text_lower, target_role):
     }
 
 
-def _check_formatting(text):
+def _check_formatting(doc):
     """Check for characters/patterns that break ATS parsers."""
     issues = 0
-    for pattern in BAD_PATTERNS:
-        issues += len(re.findall(pattern, text))
+    for match in _FORMATTING_RE.finditer(doc.text):
+        length = 1 + len(match.group("run"))
+        min_run = _FORMATTING_RUNS.get(match.group("char"))
+        if min_run is None:
+            issues += length
+        elif length >= min_run:
+            issues += 1
 
     score = max(0, 100 - issues * 15)
     status = _status(score)
@@ -369,26 +452,22 @@ def _check_formatting(text):
     }
 
 
-def _check_education(text_lower):
+def _check_education(doc):
     """Check for education details."""
+    text_lower = doc.text_lower
     found = 0
 
-    degrees = [
-        "b.tech", "btech", "b.e", "b.sc", "bsc", "m.tech", "mtech", "m.sc", "msc",
-        "m.s.", "b.s.", "bachelor", "master", "mba", "phd", "ph.d", "diploma",
-        "associate", "b.a.", "m.a.", "b.com", "m.com", "bca", "mca",
-    ]
-    if any(d in text_lower for d in degrees):
+    if _DEGREE_RE.search(text_lower):
         found += 1
 
-    if re.search(r"university|college|institute|iit|nit|iiit|school", text_lower):
+    if _INSTITUTION_RE.search(text_lower):
         found += 1
 
-    if re.search(r"20[0-3]\d|19[89]\d", text_lower):
+    if _YEAR_RE.search(text_lower):
         found += 1
 
     # GPA / CGPA
-    if re.search(r"gpa|cgpa|percentage|grade|first class|distinction", text_lower):
+    if _GRADE_RE.search(text_lower):
         found += 0.5
 
     score = min(100, round(found / 3 * 100))
@@ -407,15 +486,16 @@ def _check_education(text_lower):
 
 # ── New Criteria ────────────────────────────────────────────────────────────
 
-def _check_consistency(text, lines):
+def _check_consistency(doc):
     """Check for date format consistency and tense usage."""
+    text = doc.text
     issues = 0
     details = []
 
     # Date format detection
-    dash_dates = len(re.findall(r"\b\d{4}\s*[-–]\s*\d{4}\b", text))
-    slash_dates = len(re.findall(r"\b\d{1,2}/\d{4}\b", text))
-    month_dates = len(re.findall(r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\s+\d{4}\b", text, re.IGNORECASE))
+    dash_dates = len(_DASH_DATE_RE.findall(text))
+    slash_dates = len(_SLASH_DATE_RE.findall(text))
+    month_dates = len(_MONTH_DATE_RE.findall(text))
     
     formats_used = sum(1 for f in [dash_dates, slash_dates, month_dates] if f > 0)
     if formats_used > 1:
@@ -427,9 +507,9 @@ def _check_consistency(text, lines):
         details.append("No dates detected")
 
     # Check for consistent bullet style
-    bullet_dash = sum(1 for l in lines if l.strip().startswith("-"))
-    bullet_dot  = sum(1 for l in lines if l.strip().startswith("*"))
-    bullet_special = sum(1 for l in lines if l.strip() and l.strip()[0] in "•◦▪")
+    bullet_dash = doc.bullet_prefixes["-"]
+    bullet_dot  = doc.bullet_prefixes["*"]
+    bullet_special = sum(doc.bullet_prefixes[b] for b in _SPECIAL_BULLETS)
     
     bullet_types = sum(1 for b in [bullet_dash, bullet_dot, bullet_special] if b > 0)
     if bullet_types > 1:
@@ -439,8 +519,8 @@ def _check_consistency(text, lines):
         details.append("Consistent bullets")
 
     # Tense mixing (simple check: past vs present in verb endings)
-    past_count = len(re.findall(r"\b\w+ed\b", text))
-    present_count = len(re.findall(r"\b(?:manage|develop|create|build|lead|design|implement|maintain|optimize|deploy)s?\b", text, re.IGNORECASE))
+    past_count = len(_PAST_TENSE_RE.findall(text))
+    present_count = len(_PRESENT_TENSE_RE.findall(text))
     if past_count > 3 and present_count > 3:
         ratio = min(past_count, present_count) / max(past_count, present_count)
         if ratio > 0.4:
@@ -465,14 +545,14 @@ def _check_consistency(text, lines):
     }
 
 
-def _check_parsability(lines, word_count):
+def _check_parsability(doc):
     """Check structural parsability — empty lines ratio, extreme line lengths, noise."""
     issues = 0
     details = []
 
     # Empty lines ratio
-    empty = sum(1 for l in lines if not l.strip())
-    total = max(len(lines), 1)
+    empty = doc.line_lengths[0]
+    total = max(len(doc.lines), 1)
     empty_ratio = empty / total
 
     if empty_ratio > 0.4:
@@ -485,7 +565,7 @@ def _check_parsability(lines, word_count):
         details.append("Good spacing")
 
     # Very long lines (> 150 chars — may indicate paragraph blocks)
-    long_lines = sum(1 for l in lines if len(l.strip()) > 150)
+    long_lines = sum(count for length, count in doc.line_lengths.items() if length > 150)
     if long_lines > 3:
         issues += 1
         details.append(f"{long_lines} overly long lines")
@@ -493,8 +573,9 @@ def _check_parsability(lines, word_count):
         details.append("Line lengths OK")
 
     # Header/footer noise (page numbers, "Page X of Y", repeated names at top/bottom)
-    noise = len(re.findall(r"page\s+\d+\s+of\s+\d+|confidential|all rights reserved", " ".join(lines), re.IGNORECASE))
-    if noise > 0:
+    # Searching the raw text is equivalent to searching " ".join(lines):
+    # the pattern treats newlines like spaces and can't match outer whitespace
+    if _NOISE_RE.search(doc.text):
         issues += 1
         details.append("Header/footer noise detected")
     else:
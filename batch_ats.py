@@ -0,0 +1,222 @@
+"""
+Batch ATS Scorer for CarrierIQ.
+Scores a directory or archive (.zip/.tar/.tar.gz) of PDF/DOCX resumes on a
+process pool and streams one JSON result per file. A file that fails or
+stalls is reported as an error without holding up the rest of the batch.
+
+Usage:
+    python batch_ats.py resumes/ --workers 8 --output results.jsonl
+    python batch_ats.py batch.zip --role "Data Scientist"
+"""
+
+import os
+import sys
+import json
+import time
+import shutil
+import tarfile
+import zipfile
+import argparse
+import tempfile
+from contextlib import contextmanager, redirect_stdout
+from concurrent.futures import ProcessPoolExecutor, wait, FIRST_COMPLETED
+from concurrent.futures.process import BrokenProcessPool
+
+RESUME_EXTENSIONS = (".pdf", ".doc", ".docx")
+
+# Seconds a single file may run before it is reported as timed out
+BATCH_FILE_TIMEOUT = float(os.getenv("BATCH_FILE_TIMEOUT", "60"))
+
+
+def _score_file(path, target_role=""):
+    """Worker: extract text and ATS-score one resume. Never raises."""
+    from ai_analyzer import extract_text_from_resume
+    from ats_scorer import score_ats
+
+    start = time.perf_counter()
+    record = {"file": path, "bytes": 0, "ats_score": None, "ats_grade": None, "error": ""}
+    try:
+        record["bytes"] = os.path.getsize(path)
+        # Parser log lines must not interleave with JSON Lines on stdout
+        with redirect_stdout(sys.stderr):
+            text = extract_text_from_resume(path)
+        if not text:
+            record["error"] = "Could not extract text"
+        else:
+            result = score_ats(text, target_role)
+            record.update({
+                "ats_score": result["ats_score"],
+                "ats_grade": result["ats_grade"],
+                "summary": result["summary"],
+                "criteria": {c["name"]: c["score"] for c in result["criteria"]},
+                "words": len(text.split()),
+            })
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["seconds"] = round(time.perf_counter() - start, 4)
+    return record
+
+
+def find_resumes(directory):
+    """All resume files under directory, sorted for stable output order."""
+    paths = []
+    for root, _, files in os.walk(directory):
+        for name in files:
+            if name.lower().endswith(RESUME_EXTENSIONS):
+                paths.append(os.path.join(root, name))
+    return sorted(paths)
+
+
+@contextmanager
+def _resume_source(source):
+    """Yield a directory of resumes, unpacking archives to a temp dir."""
+    if os.path.isdir(source):
+        yield source
+        return
+
+    tmpdir = tempfile.mkdtemp(prefix="carrieriq-batch-")
+    try:
+        if zipfile.is_zipfile(source):
+            with zipfile.ZipFile(source) as archive:
+                archive.extractall(tmpdir)
+        elif tarfile.is_tarfile(source):
+            with tarfile.open(source) as archive:
+                archive.extractall(tmpdir, filter="data")
+        else:
+            raise ValueError(f"{source} is not a directory, zip or tar archive")
+        yield tmpdir
+    finally:
+        shutil.rmtree(tmpdir, ignore_errors=True)
+
+
+def _kill_pool(pool):
+    """Terminate every worker so a stalled parse can't block shutdown."""
+    for process in list(getattr(pool, "_processes", {}).values()):
+        process.terminate()
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _error_record(path, error, seconds=None):
+    return {"file": path, "ats_score": None, "ats_grade": None, "error": error, "seconds": seconds}
+
+
+def score_paths(paths, target_role="", workers=None, file_timeout=BATCH_FILE_TIMEOUT):
+    """
+    Score resume files on a process pool, yielding results as they finish.
+
+    At most `workers` files are in flight, so each one's submit time is
+    effectively its start time. A file running longer than `file_timeout`
+    is reported as an error; the pool is then replaced and the other
+    in-flight files are resubmitted.
+
+    If a worker process dies (e.g. a crash inside a PDF library), the pool
+    is replaced and every file that was in flight is retried once on its
+    own, so only the file that actually crashes is reported.
+    """
+    workers = workers or os.cpu_count() or 1
+    queue = list(reversed(paths))
+    pool = ProcessPoolExecutor(max_workers=workers)
+    in_flight = {}
+    isolated = set()  # in flight during a crash: rerun alone
+
+    try:
+        while queue or in_flight:
+            crashed = False
+            while queue and len(in_flight) < workers:
+                path = queue[-1]
+                if in_flight and (path in isolated or any(p in isolated for p, _ in in_flight.values())):
+                    break
+                queue.pop()
+                try:
+                    in_flight[pool.submit(_score_file, path, target_role)] = (path, time.monotonic())
+                except BrokenProcessPool:
+                    queue.append(path)
+                    crashed = True
+                    break
+
+            if not crashed:
+                done, _ = wait(in_flight, timeout=1.0, return_when=FIRST_COMPLETED)
+                for future in done:
+                    try:
+                        record = future.result()
+                    except BrokenProcessPool:
+                        crashed = True
+                        continue
+                    except Exception as e:
+                        record = _error_record(in_flight[future][0], f"{type(e).__name__}: {e}")
+                    del in_flight[future]
+                    yield record
+
+            if crashed:
+                _kill_pool(pool)
+                pool = ProcessPoolExecutor(max_workers=workers)
+                lost = [path for path, _ in in_flight.values()]
+                in_flight.clear()
+                if len(lost) == 1 and lost[0] in isolated:
+                    yield _error_record(lost[0], "Worker process crashed")
+                else:
+                    isolated.update(lost)
+                    queue.extend(reversed(lost))
+                continue
+
+            now = time.monotonic()
+            overdue = [f for f, (_, started) in in_flight.items() if now - started > file_timeout]
+            if overdue:
+                for future in overdue:
+                    path, _ = in_flight.pop(future)
+                    yield _error_record(path, f"Timed out after {file_timeout:g}s", file_timeout)
+                _kill_pool(pool)
+                pool = ProcessPoolExecutor(max_workers=workers)
+                queue.extend(path for path, _ in in_flight.values())
+                in_flight.clear()
+    finally:
+        if in_flight:
+            _kill_pool(pool)
+        else:
+            pool.shutdown()
+
+
+def score_batch(source, target_role="", workers=None, file_timeout=BATCH_FILE_TIMEOUT):
+    """Score every resume in a directory or archive; yields one dict per file."""
+    with _resume_source(source) as directory:
+        for record in score_paths(find_resumes(directory), target_role, workers, file_timeout):
+            if directory != source:
+                record["file"] = os.path.relpath(record["file"], directory)
+            yield record
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="directory or .zip/.tar archive of resumes")
+    parser.add_argument("--role", default="", help="target role for keyword relevance")
+    parser.add_argument("--workers", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--timeout", type=float, default=BATCH_FILE_TIMEOUT, help="per-file timeout in seconds")
+    parser.add_argument("--output", help="JSON Lines output file (default: stdout)")
+    args = parser.parse_args()
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    start = time.perf_counter()
+    total = failed = total_bytes = 0
+
+    try:
+        for record in score_batch(args.source, args.role, args.workers, args.timeout):
+            out.write(json.dumps(record) + "\n")
+            out.flush()
+            total += 1
+            total_bytes += record.get("bytes", 0) or 0
+            failed += bool(record["error"])
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    elapsed = time.perf_counter() - start
+    print(
+        f"[Batch ATS] {total} files ({failed} failed) in {elapsed:.2f}s — "
+        f"{total / elapsed if elapsed else 0:.1f} files/s, "
+        f"{total_bytes / 1e6 / elapsed if elapsed else 0:.2f} MB/s",
+        file=sys.stderr,
+    )
+
+
+if __name__ == "__main__":
+    main()
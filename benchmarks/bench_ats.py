@@ -0,0 +1,81 @@
+"""
+Benchmark ATS scoring throughput for CarrierIQ.
+
+Times ats_scorer.score_ats on synthetic resumes of several sizes. With
+--compare REV, also loads ats_scorer.py as it was at git revision REV,
+checks both versions return identical results and prints the speedup.
+
+Usage:
+    python benchmarks/bench_ats.py
+    python benchmarks/bench_ats.py --compare HEAD~1 --pages 1,2,5,10
+"""
+
+import os
+import sys
+import time
+import argparse
+import subprocess
+import importlib.util
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import ats_scorer  # noqa: E402
+from bench_pdf_backends import synthetic_resume_text  # noqa: E402
+
+
+def load_revision(rev):
+    """Import ats_scorer.py from a git revision as a standalone module."""
+    source = subprocess.run(
+        ["git", "show", f"{rev}:ats_scorer.py"],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout
+    spec = importlib.util.spec_from_loader(f"ats_scorer_{rev}", loader=None)
+    module = importlib.util.module_from_spec(spec)
+    exec(compile(source, f"ats_scorer.py@{rev}", "exec"), module.__dict__)
+    return module
+
+
+def ops_per_sec(fn, text, role, min_time):
+    """Run fn repeatedly for at least min_time seconds; return calls/sec."""
+    fn(text, role)
+    calls, start = 0, time.perf_counter()
+    while True:
+        fn(text, role)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return calls / elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", default="1,2,5,10", help="synthetic resume sizes in pages")
+    parser.add_argument("--role", default="Data Scientist")
+    parser.add_argument("--compare", metavar="REV", help="git revision to compare against")
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds per measurement")
+    args = parser.parse_args()
+
+    baseline = load_revision(args.compare) if args.compare else None
+
+    header = f"{'pages':>5} {'words':>7} {'current ops/s':>14}"
+    if baseline:
+        header += f" {args.compare + ' ops/s':>16} {'speedup':>8}"
+    print(header)
+
+    for pages in (int(p) for p in args.pages.split(",")):
+        text = synthetic_resume_text(pages, seed=pages)
+        current = ops_per_sec(ats_scorer.score_ats, text, args.role, args.min_time)
+        line = f"{pages:>5} {len(text.split()):>7} {current:>14.1f}"
+
+        if baseline:
+            if baseline.score_ats(text, args.role) != ats_scorer.score_ats(text, args.role):
+                print(f"WARNING: results differ from {args.compare} at {pages} pages")
+            before = ops_per_sec(baseline.score_ats, text, args.role, args.min_time)
+            line += f" {before:>16.1f} {current / before:>7.2f}x"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
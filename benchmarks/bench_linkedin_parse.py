@@ -0,0 +1,98 @@
+"""
+Benchmark LinkedIn job search parsing for CarrierIQ.
+
+Times job_scraper.parse_linkedin_jobs (lxml, incremental, early exit) on
+saved search pages against the previous BeautifulSoup html.parser path,
+checks both produce the same jobs, and reports parse time per page.
+
+Usage:
+    python benchmarks/bench_linkedin_parse.py
+    python benchmarks/bench_linkedin_parse.py --max-results 5,25 --pages fixtures/my_page.html
+"""
+
+import os
+import re
+import sys
+import time
+import argparse
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+
+from bs4 import BeautifulSoup  # noqa: E402
+from job_scraper import parse_linkedin_jobs  # noqa: E402
+
+DEFAULT_PAGES = [os.path.join(HERE, "fixtures", "linkedin_search.html")]
+
+
+def bs4_parse(html, location="India", max_results=5):
+    """Reference: the html.parser + per-card regex lookups parse_linkedin_jobs replaced."""
+    results = []
+    soup = BeautifulSoup(html, "html.parser")
+    job_cards = soup.find_all("div", class_="base-card")
+    if not job_cards:
+        job_cards = soup.find_all("li", class_=re.compile(r"result-card"))
+
+    seen_companies = set()
+    for card in job_cards:
+        if len(results) >= max_results:
+            break
+        title_el = card.find("h3", class_=re.compile(r"base-search-card__title"))
+        title = title_el.get_text(strip=True) if title_el else ""
+        company_el = card.find("h4", class_=re.compile(r"base-search-card__subtitle"))
+        company = company_el.get_text(strip=True) if company_el else ""
+        loc_el = card.find("span", class_=re.compile(r"job-search-card__location"))
+        loc = loc_el.get_text(strip=True) if loc_el else location
+        link_el = card.find("a", class_=re.compile(r"base-card__full-link"))
+        job_url = link_el["href"] if link_el and link_el.get("href") else ""
+
+        if company and company not in seen_companies:
+            seen_companies.add(company)
+            results.append({
+                "company": company,
+                "title": title,
+                "location": loc,
+                "url": job_url.split("?")[0] if job_url else "",
+                "salary": "",
+                "source": "LinkedIn",
+            })
+    return results
+
+
+def ms_per_call(fn, html, max_results, min_time):
+    """Mean milliseconds per call over at least min_time seconds."""
+    fn(html, max_results=max_results)
+    calls, start = 0, time.perf_counter()
+    while True:
+        fn(html, max_results=max_results)
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            return elapsed / calls * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", nargs="+", default=DEFAULT_PAGES, help="saved LinkedIn search pages")
+    parser.add_argument("--max-results", default="5,10,25", help="comma-separated max_results values")
+    parser.add_argument("--min-time", type=float, default=1.0, help="seconds per measurement")
+    args = parser.parse_args()
+
+    print(f"{'page':<24} {'KB':>6} {'max':>4} {'jobs':>5} {'lxml ms':>9} {'bs4 ms':>9} {'speedup':>8}")
+    for path in args.pages:
+        with open(path, encoding="utf-8") as f:
+            html = f.read()
+        for max_results in (int(n) for n in args.max_results.split(",")):
+            jobs = parse_linkedin_jobs(html, max_results=max_results)
+            if jobs != bs4_parse(html, max_results=max_results):
+                print(f"WARNING: results differ from the BeautifulSoup path for {path} (max {max_results})")
+            current = ms_per_call(parse_linkedin_jobs, html, max_results, args.min_time)
+            before = ms_per_call(bs4_parse, html, max_results, args.min_time)
+            print(
+                f"{os.path.basename(path):<24} {len(html) / 1024:>6.0f} {max_results:>4} {len(jobs):>5} "
+                f"{current:>9.2f} {before:>9.2f} {before / current:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,244 @@
+"""
+Benchmark suite for the CarrierIQ analysis hot paths.
+
+Covers _fuzzy_match, the compiled skill matcher, extract_skills_from_text,
+score_skills, find_best_roles, rank_profiles, score_ats and
+build_learning_roadmap across synthetic resumes (1-10 pages), the text
+fixtures in benchmarks/fixtures/ and skill lists of 1-200 entries.
+
+Each case reports ops/sec, p50/p99 latency and peak traced memory. Results
+can be saved as a named baseline and later compared against it; cases
+whose throughput drops by more than --threshold are flagged and the run
+exits with status 1.
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --save main
+    python benchmarks/run_benchmarks.py --compare main --threshold 15
+    python benchmarks/run_benchmarks.py --filter score_ats --min-time 2
+"""
+
+import os
+import sys
+import gc
+import json
+import time
+import random
+import argparse
+import itertools
+import platform
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(HERE, ".."))
+sys.path.insert(0, HERE)
+
+import skill_scorer  # noqa: E402
+from skill_scorer import (  # noqa: E402
+    SKILL_MATCHER, _fuzzy_match, _normalize, _all_role_skills,
+    extract_skills_from_text, score_skills, find_best_roles, rank_profiles,
+)
+from ats_scorer import score_ats  # noqa: E402
+from learning_resources import build_learning_roadmap  # noqa: E402
+from bench_pdf_backends import synthetic_resume_text  # noqa: E402
+
+FIXTURES_DIR = os.path.join(HERE, "fixtures")
+BASELINES_DIR = os.path.join(HERE, "baselines")
+
+PAGE_SIZES = [1, 2, 5, 10]
+SKILL_COUNTS = [1, 10, 50, 200]
+
+
+# ── Inputs ──────────────────────────────────────────────────────────────────
+
+def _typo(skill, rng):
+    """Drop one character so the fuzzy fallback path is exercised."""
+    if len(skill) < 4:
+        return skill
+    i = rng.randrange(len(skill))
+    return skill[:i] + skill[i + 1:]
+
+
+def skill_list(count, seed=0):
+    """count user skills: mostly known skills, some with typos or unknown."""
+    rng = random.Random(seed)
+    vocab = sorted(set(_all_role_skills()))
+    skills = []
+    for i in range(count):
+        skill = rng.choice(vocab)
+        roll = rng.random()
+        if roll < 0.2:
+            skill = _typo(skill, rng)
+        elif roll < 0.3:
+            skill = f"tool{i}"
+        skills.append(skill)
+    return skills
+
+
+def load_fixtures():
+    fixtures = {}
+    if os.path.isdir(FIXTURES_DIR):
+        for name in sorted(os.listdir(FIXTURES_DIR)):
+            if name.endswith(".txt"):
+                with open(os.path.join(FIXTURES_DIR, name), encoding="utf-8") as f:
+                    fixtures[os.path.splitext(name)[0]] = f.read()
+    return fixtures
+
+
+def build_cases():
+    """Return [(name, fn, setup)]; setup (or None) runs untimed before each call."""
+    cases = []
+    resumes = {f"{p}p": synthetic_resume_text(p, seed=p) for p in PAGE_SIZES}
+    resumes.update({f"fixture:{name}": text for name, text in load_fixtures().items()})
+
+    pairs = list(zip(skill_list(200, seed=1), _all_role_skills()[:200]))
+    pair_iter = itertools.cycle(pairs)
+    cases.append(("_fuzzy_match", lambda: _fuzzy_match(*next(pair_iter)), None))
+
+    # _compute bypasses the LRU, so cycling a fixed list stays a cold lookup
+    cold_skills = itertools.cycle([_normalize(s) for s in skill_list(500, seed=2)])
+    cases.append(("skill_matcher[cold]", lambda: SKILL_MATCHER._compute(next(cold_skills), 0.7), None))
+
+    for label, text in resumes.items():
+        cases.append((f"extract_skills_from_text[{label}]", lambda t=text: extract_skills_from_text(t), None))
+        cases.append((f"score_ats[{label}]", lambda t=text: score_ats(t, "Data Scientist"), None))
+
+    clear_matcher = SKILL_MATCHER._lookup.cache_clear
+    for count in SKILL_COUNTS:
+        skills = ", ".join(skill_list(count, seed=count))
+        cases.append((f"score_skills[{count} skills]", lambda s=skills: score_skills(s, "Data Scientist"), None))
+        cases.append((f"score_skills[{count} skills, cold]", lambda s=skills: score_skills(s, "Data Scientist"), clear_matcher))
+        cases.append((f"find_best_roles[{count} skills]", lambda s=skills: find_best_roles(s), None))
+        cases.append((f"find_best_roles[{count} skills, cold]", lambda s=skills: find_best_roles(s), clear_matcher))
+
+    profiles = [", ".join(skill_list(20, seed=i)) for i in range(100)]
+    cases.append(("rank_profiles[100 x 20 skills]", lambda: rank_profiles(profiles), None))
+
+    for count in SKILL_COUNTS:
+        missing = [s.title() for s in skill_list(count, seed=count + 7)]
+        third = max(1, count // 3)
+        core, important, nice = missing[:third], missing[third:2 * third], missing[2 * third:]
+        cases.append((
+            f"build_learning_roadmap[{count} missing]",
+            lambda c=core, i=important, n=nice: build_learning_roadmap(c, i, n),
+            None,
+        ))
+
+    return cases
+
+
+# ── Measurement ─────────────────────────────────────────────────────────────
+
+def _percentile(sorted_values, pct):
+    index = min(len(sorted_values) - 1, round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def measure(fn, setup, min_time, min_calls=5):
+    """Time calls individually until min_time elapses; then trace one call's memory."""
+    # Don't bill earlier cases' garbage to this one via a full collection
+    gc.collect()
+    if setup:
+        setup()
+    fn()  # warm-up
+
+    samples = []
+    deadline = time.perf_counter() + min_time
+    while len(samples) < min_calls or time.perf_counter() < deadline:
+        if setup:
+            setup()
+        start = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - start)
+
+    if setup:
+        setup()
+    tracemalloc.start()
+    fn()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    samples.sort()
+    return {
+        "ops_per_sec": len(samples) / sum(samples),
+        "p50_ms": _percentile(samples, 50) * 1000,
+        "p99_ms": _percentile(samples, 99) * 1000,
+        "peak_kb": peak / 1024,
+        "calls": len(samples),
+    }
+
+
+# ── Baselines ───────────────────────────────────────────────────────────────
+
+def _baseline_path(name):
+    return os.path.join(BASELINES_DIR, f"{name}.json")
+
+
+def save_baseline(name, results):
+    os.makedirs(BASELINES_DIR, exist_ok=True)
+    payload = {
+        "created": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "skill_db_version": skill_scorer.SKILL_DB_VERSION,
+        "results": results,
+    }
+    with open(_baseline_path(name), "w", encoding="utf-8") as f:
+        json.dump(payload, f, indent=2, sort_keys=True)
+    print(f"\nSaved baseline '{name}' -> {_baseline_path(name)}")
+
+
+def load_baseline(name):
+    with open(_baseline_path(name), encoding="utf-8") as f:
+        return json.load(f)["results"]
+
+
+# ── Main ────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--filter", default="", help="only run cases whose name contains this")
+    parser.add_argument("--min-time", type=float, default=0.5, help="seconds per case")
+    parser.add_argument("--save", metavar="NAME", help="save results as baseline NAME")
+    parser.add_argument("--compare", metavar="NAME", help="compare against baseline NAME")
+    parser.add_argument("--threshold", type=float, default=15.0,
+                        help="flag cases whose ops/sec drops more than this percent")
+    args = parser.parse_args()
+
+    baseline = load_baseline(args.compare) if args.compare else {}
+    results, regressions = {}, []
+
+    header = f"{'case':<50} {'ops/s':>10} {'p50 ms':>9} {'p99 ms':>9} {'peak KB':>9}"
+    if baseline:
+        header += f" {'vs base':>9}"
+    print(header)
+
+    for name, fn, setup in build_cases():
+        if args.filter not in name:
+            continue
+        stats = measure(fn, setup, args.min_time)
+        results[name] = stats
+        line = (
+            f"{name:<50} {stats['ops_per_sec']:>10.1f} {stats['p50_ms']:>9.3f} "
+            f"{stats['p99_ms']:>9.3f} {stats['peak_kb']:>9.1f}"
+        )
+        if name in baseline:
+            change = (stats["ops_per_sec"] / baseline[name]["ops_per_sec"] - 1) * 100
+            line += f" {change:>+8.1f}%"
+            if change < -args.threshold:
+                regressions.append((name, change))
+                line += "  REGRESSION"
+        print(line, flush=True)
+
+    if args.save:
+        save_baseline(args.save, results)
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:g}%:")
+        for name, change in regressions:
+            print(f"  {name}: {change:+.1f}%")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,188 @@
+"""
+Bulk Analyzer CLI for CarrierIQ.
+Runs the full analyze_resume / analyze_profile pipeline over a directory of
+resumes or a CSV of manual profiles, without going through the web app.
+
+Results are appended to a JSON Lines file that doubles as the checkpoint:
+re-running the same command skips every input already in the output, so an
+interrupted run resumes where it stopped. Items lost to a crashed worker
+process are recorded with "retry": true and analyzed again on the next run.
+
+CSV columns: name, target_role, skills, education (optional: id)
+
+Usage:
+    python bulk_analyze.py resumes/ -o results.jsonl --workers 8
+    python bulk_analyze.py profiles.csv -o results.jsonl --no-jobs
+"""
+
+import os
+import sys
+import csv
+import json
+import time
+import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+
+from batch_ats import find_resumes
+
+
+# ── Inputs ──────────────────────────────────────────────────────────────────
+
+def load_inputs(source):
+    """Return [(item_id, kind, payload)] for a resume directory or profile CSV."""
+    if os.path.isdir(source):
+        return [
+            (os.path.relpath(path, source), "resume", {"path": path})
+            for path in find_resumes(source)
+        ]
+
+    items = []
+    with open(source, newline="", encoding="utf-8-sig") as f:
+        for index, row in enumerate(csv.DictReader(f)):
+            item_id = (row.get("id") or "").strip() or f"row-{index + 1}"
+            items.append((item_id, "profile", {
+                "name": (row.get("name") or "").strip(),
+                "target_role": (row.get("target_role") or "").strip(),
+                "skills": (row.get("skills") or "").strip(),
+                "education": (row.get("education") or "").strip(),
+            }))
+    return items
+
+
+# ── Checkpoint ──────────────────────────────────────────────────────────────
+
+def load_checkpoint(output_path):
+    """
+    IDs already written to output_path, except records marked for retry.
+    A partial last line from an interrupted write is truncated so new
+    records start on a clean line.
+    """
+    if not os.path.exists(output_path):
+        return set()
+
+    with open(output_path, "rb+") as f:
+        data = f.read()
+        if data and not data.endswith(b"\n"):
+            f.truncate(data.rfind(b"\n") + 1)
+            data = data[: data.rfind(b"\n") + 1]
+
+    done = set()
+    for line in data.decode("utf-8").splitlines():
+        try:
+            record = json.loads(line)
+            if not record.get("retry"):
+                done.add(record["id"])
+        except (ValueError, KeyError, AttributeError):
+            continue
+    return done
+
+
+# ── Worker ──────────────────────────────────────────────────────────────────
+
+def _analyze_item(item_id, kind, payload, fetch_jobs):
+    """Worker: run one pipeline and return a JSON-ready record. Never raises."""
+    from ai_analyzer import analyze_profile, analyze_resume, extract_text_from_resume
+
+    start = time.perf_counter()
+    record = {"id": item_id, "kind": kind, "error": ""}
+    try:
+        if kind == "resume":
+            text = extract_text_from_resume(payload["path"])
+            if not text:
+                record["error"] = "Could not extract text"
+            else:
+                record["result"] = analyze_resume(text, fetch_jobs=fetch_jobs)
+        else:
+            record["result"] = analyze_profile(
+                payload["name"], payload["target_role"], payload["skills"],
+                payload["education"], fetch_jobs=fetch_jobs,
+            )
+    except Exception as e:
+        record["error"] = f"{type(e).__name__}: {e}"
+    record["seconds"] = round(time.perf_counter() - start, 4)
+    return record
+
+
+# ── Summary ─────────────────────────────────────────────────────────────────
+
+def _percentile(sorted_values, pct):
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, round(pct / 100 * (len(sorted_values) - 1)))
+    return sorted_values[index]
+
+
+def print_summary(latencies, failed, skipped, elapsed, out=sys.stderr):
+    latencies = sorted(latencies)
+    done = len(latencies)
+    print(f"[Bulk Analyze] {done} analyzed ({failed} failed), {skipped} skipped from checkpoint", file=out)
+    print(f"[Bulk Analyze] {elapsed:.2f}s wall, {done / elapsed if elapsed else 0:.2f} items/s", file=out)
+    if latencies:
+        print(
+            "[Bulk Analyze] latency p50 {:.3f}s · p95 {:.3f}s · p99 {:.3f}s · max {:.3f}s".format(
+                _percentile(latencies, 50), _percentile(latencies, 95),
+                _percentile(latencies, 99), latencies[-1],
+            ),
+            file=out,
+        )
+
+
+# ── Main ────────────────────────────────────────────────────────────────────
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("source", help="directory of resumes or CSV of profiles")
+    parser.add_argument("-o", "--output", required=True, help="JSON Lines output (also the checkpoint)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1)
+    parser.add_argument("--no-jobs", action="store_true", help="skip live job scraping")
+    parser.add_argument("--threads", action="store_true",
+                        help="use threads instead of processes (better when scraping dominates)")
+    args = parser.parse_args()
+
+    items = load_inputs(args.source)
+    done = load_checkpoint(args.output)
+    pending = [item for item in items if item[0] not in done]
+    skipped = len(items) - len(pending)
+
+    executor_cls = ThreadPoolExecutor if args.threads else ProcessPoolExecutor
+    latencies, failed, lost = [], 0, 0
+    start = time.perf_counter()
+
+    with open(args.output, "a", encoding="utf-8") as out, executor_cls(max_workers=args.workers) as pool:
+        futures = {
+            pool.submit(_analyze_item, item_id, kind, payload, not args.no_jobs): (item_id, kind)
+            for item_id, kind, payload in pending
+        }
+        try:
+            for future in as_completed(futures):
+                try:
+                    record = future.result()
+                except BrokenProcessPool as e:
+                    # A worker process died; every item still queued fails the same way
+                    item_id, kind = futures[future]
+                    out.write(json.dumps({
+                        "id": item_id, "kind": kind, "error": f"BrokenProcessPool: {e}", "retry": True,
+                    }) + "\n")
+                    out.flush()
+                    lost += 1
+                    continue
+                out.write(json.dumps(record) + "\n")
+                out.flush()
+                latencies.append(record["seconds"])
+                failed += bool(record["error"])
+                if len(latencies) % 50 == 0:
+                    print(f"[Bulk Analyze] {len(latencies)}/{len(pending)} done", file=sys.stderr)
+        except KeyboardInterrupt:
+            print("[Bulk Analyze] Interrupted — re-run the same command to resume", file=sys.stderr)
+            for future in futures:
+                future.cancel()
+
+    if lost:
+        print(f"[Bulk Analyze] {lost} items lost to a crashed worker — re-run the same command to retry them",
+              file=sys.stderr)
+    print_summary(latencies, failed, skipped, time.perf_counter() - start)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,113 @@
+"""
+Content-Addressed Disk Cache for CarrierIQ.
+Stores JSON-serializable values on disk under hashed keys so repeated
+analyses of the same resume survive restarts. Evicts least recently used
+entries once the store grows past its size limit.
+"""
+
+import os
+import json
+import hashlib
+import threading
+
+# Bump when extraction or scoring logic changes so old entries are ignored
+CACHE_SCHEMA = 1
+
+
+def content_hash(data):
+    """SHA-256 hex digest of bytes or text."""
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return hashlib.sha256(data).hexdigest()
+
+
+class DiskCache:
+    """
+    JSON values stored one file per key under `directory`.
+
+    Writes are atomic (temp file + rename), so readers never see partial
+    entries. Reads refresh the file's mtime; when the total size exceeds
+    `max_bytes`, the oldest files are removed until the store is back under
+    90% of the limit.
+    """
+
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size = None
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        digest = content_hash(json.dumps([CACHE_SCHEMA, key]))
+        return os.path.join(self.directory, digest[:2], digest + ".json")
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                value = json.load(f)
+            os.utime(path)
+            return value
+        except (OSError, ValueError):
+            return default
+
+    def set(self, key, value):
+        path = self._path(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(value, f)
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError) as e:
+            print(f"[Disk Cache] Write failed: {e}")
+            if os.path.exists(tmp):
+                os.remove(tmp)
+            return
+
+        with self._lock:
+            if self._size is None:
+                self._size = self._scan_size()
+            else:
+                self._size += os.path.getsize(path)
+            if self._size > self.max_bytes:
+                self._evict()
+
+    def _entries(self):
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                if name.endswith(".json"):
+                    path = os.path.join(root, name)
+                    try:
+                        st = os.stat(path)
+                    except OSError:
+                        continue
+                    yield st.st_mtime, st.st_size, path
+
+    def _scan_size(self):
+        return sum(size for _, size, _ in self._entries())
+
+    def _evict(self):
+        """Remove least recently used files down to 90% of max_bytes."""
+        entries = sorted(self._entries())
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        for _, size, path in entries:
+            if total <= target:
+                break
+            try:
+                os.remove(path)
+                total -= size
+            except OSError:
+                continue
+        self._size = total
+
+    def clear(self):
+        with self._lock:
+            for _, _, path in list(self._entries()):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._size = 0
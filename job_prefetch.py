@@ -0,0 +1,167 @@
+"""
+Background Job Prefetcher for CarrierIQ.
+Periodically warms the job results cache for every role x score tier so
+user-facing requests read precomputed listings instead of scraping live.
+"""
+
+import os
+import time
+import random
+import threading
+
+from skill_scorer import ROLE_SKILLS
+from job_scraper import (
+    JOB_CACHE,
+    job_sources,
+    _cache_key,
+    _fetch_and_cache,
+)
+
+# Config
+PREFETCH_ENABLED = os.getenv("JOB_PREFETCH", "").lower() in ("1", "true", "yes")
+PREFETCH_INTERVAL = float(os.getenv("JOB_PREFETCH_INTERVAL", "600"))
+PREFETCH_LOCATION = os.getenv("JOB_PREFETCH_LOCATION", "India")
+PREFETCH_MAX_RESULTS = 5
+
+# Representative score for each tier used by _build_search_query
+SCORE_TIERS = {
+    "junior": 20,
+    "plain": 50,
+    "senior": 90,
+}
+
+# Minimum seconds between requests to each source (plus up to 50% jitter)
+SOURCE_PACING = {
+    "LinkedIn": float(os.getenv("JOB_PREFETCH_LINKEDIN_DELAY", "6")),
+    "Adzuna": float(os.getenv("JOB_PREFETCH_ADZUNA_DELAY", "1.5")),
+}
+
+
+class JobPrefetcher:
+    """
+    Runs one paced worker thread per job source. Each cycle fetches every
+    role x tier query into JOB_CACHE, then sleeps for a jittered interval.
+    """
+
+    def __init__(self, interval=PREFETCH_INTERVAL, location=PREFETCH_LOCATION,
+                 max_results=PREFETCH_MAX_RESULTS):
+        self.interval = interval
+        self.location = location
+        self.max_results = max_results
+        self._sources = {source.name: source for source in job_sources()}
+
+        self._stop = threading.Event()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._keys = {}
+        self._counters = {
+            name: {"cycles": 0, "fetched": 0, "empty": 0, "failed": 0}
+            for name in self._sources
+        }
+
+    def start(self):
+        """Start one daemon worker per source (no-op if already running)."""
+        if self._threads:
+            return
+        for name in self._sources:
+            thread = threading.Thread(
+                target=self._run, args=(name,), name=f"job-prefetch-{name}", daemon=True
+            )
+            thread.start()
+            self._threads.append(thread)
+        print(f"[Job Prefetch] Started for {', '.join(self._sources)}")
+
+    def stop(self):
+        self._stop.set()
+        for thread in self._threads:
+            thread.join(timeout=1)
+        self._threads = []
+
+    def _queries(self):
+        """Every (role, tier, score) combination to warm, shuffled per cycle."""
+        queries = [
+            (role.title(), tier, score)
+            for role in ROLE_SKILLS
+            for tier, score in SCORE_TIERS.items()
+        ]
+        random.shuffle(queries)
+        return queries
+
+    def _run(self, source):
+        job_source = self._sources[source]
+        pacing = SOURCE_PACING.get(source, 2.0)
+
+        while not self._stop.is_set():
+            for role, tier, score in self._queries():
+                if self._stop.is_set():
+                    return
+                self._prefetch_one(job_source, role, tier, score)
+                self._stop.wait(pacing * (1 + random.random() * 0.5))
+
+            with self._lock:
+                self._counters[source]["cycles"] += 1
+            self._stop.wait(self.interval * random.uniform(0.9, 1.1))
+
+    def _prefetch_one(self, job_source, role, tier, score):
+        source = job_source.name
+        limit = job_source.limit(self.max_results)
+        key = _cache_key(role, [], score, self.location, source, limit)
+        error = ""
+        try:
+            results = _fetch_and_cache(key, job_source, [], role, self.location, limit, score)
+        except Exception as e:
+            results = []
+            error = str(e)
+
+        with self._lock:
+            counters = self._counters[source]
+            if error:
+                counters["failed"] += 1
+            elif results:
+                counters["fetched"] += 1
+            else:
+                counters["empty"] += 1
+
+            record = self._keys.setdefault(key, {
+                "query": key[0], "location": key[1], "source": source, "tier": tier,
+                "last_success": None,
+            })
+            record["last_attempt"] = time.time()
+            record["results"] = len(results)
+            record["error"] = error
+            if results:
+                record["last_success"] = record["last_attempt"]
+
+    def status(self):
+        """Freshness per key plus per-source counters, for the status endpoint."""
+        now = time.time()
+        with self._lock:
+            keys = []
+            for record in self._keys.values():
+                last = record["last_success"]
+                keys.append({
+                    **record,
+                    "age_seconds": round(now - last, 1) if last else None,
+                    "fresh": bool(last) and now - last <= JOB_CACHE.ttl,
+                })
+            counters = {name: dict(c) for name, c in self._counters.items()}
+
+        keys.sort(key=lambda k: (k["source"], k["query"]))
+        return {
+            "running": bool(self._threads) and not self._stop.is_set(),
+            "interval_seconds": self.interval,
+            "sources": counters,
+            "keys_total": len(keys),
+            "keys_fresh": sum(1 for k in keys if k["fresh"]),
+            "keys": keys,
+        }
+
+
+PREFETCHER = JobPrefetcher()
+
+
+def start_prefetcher():
+    """Start the background prefetcher if enabled via JOB_PREFETCH."""
+    if PREFETCH_ENABLED:
+        PREFETCHER.start()
+    return PREFETCHER
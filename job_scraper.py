@@ -4,21 +4,66 @@ Fetches real job postings from LinkedIn (public scraping) and Adzuna (free API).
 """
 
 import os
-import re
 import json
 import time
 import random
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
 from urllib.parse import quote_plus
-from bs4 import BeautifulSoup
+from lxml import etree
 from dotenv import load_dotenv
 
+from metrics import (
+    CACHE_REQUESTS, JOB_SOURCE_SECONDS, JOB_SOURCES_IN_FLIGHT,
+    JOB_SOURCE_ERRORS, JOB_SOURCE_DEADLINE_MISSES, JOB_SOURCE_CIRCUIT_STATE,
+)
+
 load_dotenv()
 
 # Config
 ADZUNA_APP_ID = os.getenv("ADZUNA_APP_ID", "")
 ADZUNA_APP_KEY = os.getenv("ADZUNA_APP_KEY", "")
 
+# Overall budget (seconds) for one search_jobs call across all sources
+SEARCH_DEADLINE = float(os.getenv("JOB_SEARCH_DEADLINE", "8"))
+
+# Local JSON job listings served by the "Fixture" source ("" disables it)
+JOB_FIXTURE_FILE = os.getenv("JOB_FIXTURE_FILE", "")
+
+# Per-source circuit breaker: open after FAILURES consecutive failures, or
+# when ERROR_RATE of the last WINDOW calls (at least MIN_CALLS) failed; probe
+# again after COOLDOWN seconds
+BREAKER_WINDOW = int(os.getenv("JOB_BREAKER_WINDOW", "20"))
+BREAKER_MIN_CALLS = int(os.getenv("JOB_BREAKER_MIN_CALLS", "5"))
+BREAKER_ERROR_RATE = float(os.getenv("JOB_BREAKER_ERROR_RATE", "0.5"))
+BREAKER_FAILURES = int(os.getenv("JOB_BREAKER_FAILURES", "3"))
+BREAKER_COOLDOWN = float(os.getenv("JOB_BREAKER_COOLDOWN", "30"))
+
+# Adaptive timeouts: p95 of recent successful calls x MULTIPLIER, kept
+# between MIN seconds and the source's configured timeout
+ADAPTIVE_TIMEOUT_MULTIPLIER = float(os.getenv("JOB_TIMEOUT_P95_MULTIPLIER", "1.5"))
+ADAPTIVE_TIMEOUT_MIN = float(os.getenv("JOB_TIMEOUT_MIN", "1.5"))
+
+# Job results cache: fresh for TTL seconds, then served stale (while a
+# background refresh runs) for up to STALE more seconds
+JOB_CACHE_TTL = float(os.getenv("JOB_CACHE_TTL", "900"))
+JOB_CACHE_STALE = float(os.getenv("JOB_CACHE_STALE", "3600"))
+JOB_CACHE_SIZE = int(os.getenv("JOB_CACHE_SIZE", "512"))
+
+# HTTP client: pooled keep-alive connections with retry/backoff on 5xx
+HTTP_POOL_CONNECTIONS = int(os.getenv("JOB_HTTP_POOL_CONNECTIONS", "4"))
+HTTP_POOL_MAXSIZE = int(os.getenv("JOB_HTTP_POOL_MAXSIZE", "16"))
+HTTP_CONNECT_TIMEOUT = float(os.getenv("JOB_HTTP_CONNECT_TIMEOUT", "3.05"))
+HTTP_READ_TIMEOUT = float(os.getenv("JOB_HTTP_READ_TIMEOUT", "10"))
+HTTP_RETRIES = int(os.getenv("JOB_HTTP_RETRIES", "2"))
+HTTP_BACKOFF = float(os.getenv("JOB_HTTP_BACKOFF", "0.3"))
+# Longest a server's Retry-After may make a retry sleep
+HTTP_RETRY_AFTER_MAX = float(os.getenv("JOB_HTTP_RETRY_AFTER_MAX", "1"))
+
 USER_AGENTS = [
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36",
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/119.0.0.0 Safari/537.36",
@@ -27,6 +72,103 @@ USER_AGENTS = [
 ]
 
 
+# HTTP Client
+
+# State of the source call running on this thread (set by JobSource.run)
+_call_state = threading.local()
+
+
+class _BoundedRetry(Retry):
+    """
+    Retry whose sleeps never exceed HTTP_RETRY_AFTER_MAX, whatever the
+    server's Retry-After says, and which stops retrying once the next sleep
+    would run past the current source call's deadline.
+    """
+
+    # Only 503 + Retry-After is retried; 429 goes straight to the breaker
+    RETRY_AFTER_STATUS_CODES = frozenset([503])
+
+    def get_retry_after(self, response):
+        retry_after = super().get_retry_after(response)
+        return None if retry_after is None else min(retry_after, HTTP_RETRY_AFTER_MAX)
+
+    def is_retry(self, method, status_code, has_retry_after=False):
+        deadline = getattr(_call_state, "deadline", None)
+        if deadline is not None:
+            next_sleep = HTTP_RETRY_AFTER_MAX if has_retry_after else self.get_backoff_time()
+            if time.monotonic() + next_sleep >= deadline:
+                return False
+        return super().is_retry(method, status_code, has_retry_after)
+
+
+def _build_session():
+    """Create the shared session with per-host connection pools and retries."""
+    retry = _BoundedRetry(
+        total=HTTP_RETRIES,
+        connect=HTTP_RETRIES,
+        read=0,  # a slow read already used its full timeout; don't repeat it
+        status=HTTP_RETRIES,
+        backoff_factor=HTTP_BACKOFF,
+        status_forcelist=(500, 502, 503, 504),
+        allowed_methods=frozenset(["GET"]),
+        respect_retry_after_header=True,
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(
+        pool_connections=HTTP_POOL_CONNECTIONS,
+        pool_maxsize=HTTP_POOL_MAXSIZE,
+        max_retries=retry,
+    )
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+_HTTP_SESSION = _build_session()
+
+
+def _http_get(url, **kwargs):
+    """
+    GET through the shared pooled session with (connect, read) timeouts.
+    Inside a source call the read timeout is that source's adaptive timeout.
+    """
+    read_timeout = getattr(_call_state, "read_timeout", None) or HTTP_READ_TIMEOUT
+    kwargs.setdefault("timeout", (HTTP_CONNECT_TIMEOUT, read_timeout))
+    return _HTTP_SESSION.get(url, **kwargs)
+
+
+def _record_source_error(source, reason):
+    """Count a failed fetch and mark the current source call as failed."""
+    JOB_SOURCE_ERRORS.inc(source, reason)
+    _call_state.error = reason
+
+
+def http_pool_stats():
+    """
+    Per-host connection pool counters from the shared session.
+
+    Returns:
+        dict mapping host -> {requests, connections, reuse_rate}
+    """
+    stats = {}
+    for prefix in ("https://", "http://"):
+        pools = _HTTP_SESSION.get_adapter(prefix).poolmanager.pools
+        for key in list(pools.keys()):
+            pool = pools.get(key)
+            if pool is None:
+                continue
+            host = f"{key.key_scheme}://{key.key_host}"
+            requests_made = pool.num_requests
+            connections = pool.num_connections
+            stats[host] = {
+                "requests": requests_made,
+                "connections": connections,
+                "reuse_rate": round(1 - connections / requests_made, 3) if requests_made else 0.0,
+            }
+    return stats
+
+
 def _get_headers():
     """Get randomized request headers to avoid detection."""
     return {
@@ -98,64 +240,115 @@ def scrape_linkedin_jobs(skills, target_role="", location="India", max_results=5
             f"&position=1&pageNum=0"
         )
 
-        response = requests.get(url, headers=_get_headers(), timeout=10)
+        response = _http_get(url, headers=_get_headers())
 
         if response.status_code != 200:
             print(f"[Job Scraper] LinkedIn returned status {response.status_code}")
+            _record_source_error("LinkedIn", "status")
             return results
 
-        soup = BeautifulSoup(response.text, "html.parser")
+        results = parse_linkedin_jobs(response.text, location, max_results)
 
-        # LinkedIn public job cards
-        job_cards = soup.find_all("div", class_="base-card")
+    except requests.exceptions.Timeout:
+        print("[Job Scraper] LinkedIn request timed out")
+        _record_source_error("LinkedIn", "timeout")
+    except Exception as e:
+        print(f"[Job Scraper] LinkedIn scraping error: {e}")
+        _record_source_error("LinkedIn", "error")
 
-        if not job_cards:
-            # Try alternative selectors
-            job_cards = soup.find_all("li", class_=re.compile(r"result-card"))
+    return results
 
-        seen_companies = set()
 
-        for card in job_cards:
-            if len(results) >= max_results:
-                break
+# LinkedIn HTML Parsing
+# Precompiled XPath selectors. Card fields match on a class substring, like
+# the regex lookups they replace; cards match the whole "base-card" class.
 
-            try:
-                # Extract job title
-                title_el = card.find("h3", class_=re.compile(r"base-search-card__title"))
-                title = title_el.get_text(strip=True) if title_el else ""
-
-                # Extract company name
-                company_el = card.find("h4", class_=re.compile(r"base-search-card__subtitle"))
-                company = company_el.get_text(strip=True) if company_el else ""
-
-                # Extract location
-                loc_el = card.find("span", class_=re.compile(r"job-search-card__location"))
-                loc = loc_el.get_text(strip=True) if loc_el else location
-
-                # Extract URL
-                link_el = card.find("a", class_=re.compile(r"base-card__full-link"))
-                job_url = link_el["href"] if link_el and link_el.get("href") else ""
-
-                if company and company not in seen_companies:
-                    seen_companies.add(company)
-                    results.append({
-                        "company": company,
-                        "title": title,
-                        "location": loc,
-                        "url": job_url.split("?")[0] if job_url else "",  # Clean URL
-                        "salary": "",
-                        "source": "LinkedIn"
-                    })
+_LINKEDIN_TITLE = etree.XPath(".//h3[contains(@class, 'base-search-card__title')]")
+_LINKEDIN_COMPANY = etree.XPath(".//h4[contains(@class, 'base-search-card__subtitle')]")
+_LINKEDIN_LOCATION = etree.XPath(".//span[contains(@class, 'job-search-card__location')]")
+_LINKEDIN_LINK = etree.XPath(".//a[contains(@class, 'base-card__full-link')]")
 
-            except Exception as e:
-                print(f"[Job Scraper] Error parsing LinkedIn card: {e}")
-                continue
+# Characters fed to the incremental parser at a time
+_LINKEDIN_CHUNK = 16384
 
-    except requests.exceptions.Timeout:
-        print("[Job Scraper] LinkedIn request timed out")
-    except Exception as e:
-        print(f"[Job Scraper] LinkedIn scraping error: {e}")
 
+def _first_text(selector, card):
+    """Stripped text of the first match, joined like get_text(strip=True)."""
+    matches = selector(card)
+    if not matches:
+        return None
+    return "".join(piece.strip() for piece in matches[0].itertext())
+
+
+def _parse_linkedin_card(card, location):
+    title = _first_text(_LINKEDIN_TITLE, card) or ""
+    company = _first_text(_LINKEDIN_COMPANY, card) or ""
+    loc = _first_text(_LINKEDIN_LOCATION, card) or location
+    links = _LINKEDIN_LINK(card)
+    job_url = (links[0].get("href") or "") if links else ""
+    return {
+        "company": company,
+        "title": title,
+        "location": loc,
+        "url": job_url.split("?")[0] if job_url else "",  # Clean URL
+        "salary": "",
+        "source": "LinkedIn"
+    }
+
+
+def parse_linkedin_jobs(html, location="India", max_results=5):
+    """
+    Parse LinkedIn's public job search HTML into job dicts, one per company.
+
+    The page is fed to lxml's incremental HTML parser in chunks, and parsing
+    stops as soon as max_results unique companies are collected. Cards are
+    div.base-card elements; li.result-card is used only if the page has none.
+    """
+    parser = etree.HTMLPullParser(events=("end",), tag=("div", "li"))
+    results = []
+    seen_companies = set()
+    legacy_cards = []
+    found_cards = False
+
+    def _add(card):
+        try:
+            job = _parse_linkedin_card(card, location)
+        except Exception as e:
+            print(f"[Job Scraper] Error parsing LinkedIn card: {e}")
+            return
+        if job["company"] and job["company"] not in seen_companies:
+            seen_companies.add(job["company"])
+            results.append(job)
+
+    def _consume_events():
+        nonlocal found_cards
+        for _, element in parser.read_events():
+            classes = element.get("class") or ""
+            if element.tag == "div" and "base-card" in classes.split():
+                found_cards = True
+                _add(element)
+                if len(results) >= max_results:
+                    return True
+            elif element.tag == "li" and not found_cards and "result-card" in classes:
+                legacy_cards.append(element)
+        return False
+
+    for offset in range(0, len(html), _LINKEDIN_CHUNK):
+        parser.feed(html[offset:offset + _LINKEDIN_CHUNK])
+        if _consume_events():
+            return results
+    try:
+        parser.close()
+    except etree.XMLSyntaxError:
+        pass  # empty or truncated page; keep whatever was parsed
+    if _consume_events():
+        return results
+
+    if not found_cards:
+        for card in legacy_cards:
+            if len(results) >= max_results:
+                break
+            _add(card)
     return results
 
 
@@ -206,10 +399,11 @@ def fetch_adzuna_jobs(skills, target_role="", location="india", max_results=5, s
             f"&content-type=application/json"
         )
 
-        response = requests.get(url, timeout=10)
+        response = _http_get(url)
 
         if response.status_code != 200:
             print(f"[Job Scraper] Adzuna returned status {response.status_code}")
+            _record_source_error("Adzuna", "status")
             return results
 
         data = response.json()
@@ -245,16 +439,393 @@ def fetch_adzuna_jobs(skills, target_role="", location="india", max_results=5, s
 
     except requests.exceptions.Timeout:
         print("[Job Scraper] Adzuna request timed out")
+        _record_source_error("Adzuna", "timeout")
     except Exception as e:
         print(f"[Job Scraper] Adzuna error: {e}")
+        _record_source_error("Adzuna", "error")
+
+    return results
+
+
+def fetch_fixture_jobs(skills, target_role="", location="India", max_results=5, score=50):
+    """
+    Serve job listings from the local JSON file at JOB_FIXTURE_FILE, for tests
+    and offline development. Returns jobs whose title shares a word with the
+    role query (the tier prefix is ignored).
+
+    Returns:
+        List of dicts with: company, title, location, url, salary, source
+    """
+    with open(JOB_FIXTURE_FILE, encoding="utf-8") as f:
+        jobs = json.load(f)
 
+    terms = set(_build_search_query(target_role, skills).lower().split())
+    results = []
+    for job in jobs:
+        if terms & set(job.get("title", "").lower().split()):
+            results.append({
+                "company": job.get("company", ""),
+                "title": job.get("title", ""),
+                "location": job.get("location", location),
+                "url": job.get("url", ""),
+                "salary": job.get("salary", ""),
+                "source": job.get("source", "Fixture"),
+            })
+            if len(results) >= max_results:
+                break
     return results
 
 
+# Job Source Registry
+
+def _source_setting(name, setting, default):
+    """Per-source override from JOB_<NAME>_<SETTING>, e.g. JOB_LINKEDIN_TIMEOUT."""
+    value = os.getenv(f"JOB_{name.upper()}_{setting}")
+    return type(default)(value) if value else default
+
+
+class SourceUnavailable(Exception):
+    """Raised when a source's circuit is open or its concurrency is saturated."""
+
+
+class CircuitBreaker:
+    """
+    Rolling error-rate and latency tracker for one job source.
+
+    closed: calls flow and outcomes are recorded. open: calls are refused
+    until `cooldown` seconds pass. half_open: one probe call is let through;
+    success closes the circuit, failure reopens it.
+    """
+
+    STATES = {"closed": 0, "half_open": 1, "open": 2}
+
+    def __init__(self, name, window=BREAKER_WINDOW, min_calls=BREAKER_MIN_CALLS,
+                 error_rate=BREAKER_ERROR_RATE, failures=BREAKER_FAILURES, cooldown=BREAKER_COOLDOWN):
+        self.name = name
+        self.min_calls = min_calls
+        self.error_rate_threshold = error_rate
+        self.failures_threshold = failures
+        self.cooldown = cooldown
+        self.state = "closed"
+        self._outcomes = deque(maxlen=window)  # (ok, seconds)
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probing = False
+        self._lock = threading.Lock()
+
+    def allow(self):
+        """True if a call may run now; moves open -> half_open after the cooldown."""
+        with self._lock:
+            if self.state == "closed":
+                return True
+            if self.state == "open":
+                if time.monotonic() - self._opened_at < self.cooldown:
+                    return False
+                self._set_state("half_open")
+            if self._probing:
+                return False
+            self._probing = True
+            return True
+
+    def is_open(self):
+        """
+        True while calls would be refused: open within the cooldown, or
+        half-open with the probe already taken. Unlike allow(), claims nothing.
+        """
+        with self._lock:
+            if self.state == "open":
+                return time.monotonic() - self._opened_at < self.cooldown
+            return self.state == "half_open" and self._probing
+
+    def record(self, ok, seconds):
+        with self._lock:
+            self._outcomes.append((ok, seconds))
+            self._consecutive_failures = 0 if ok else self._consecutive_failures + 1
+
+            if self.state == "half_open":
+                self._probing = False
+                if ok:
+                    self._outcomes.clear()
+                    self._outcomes.append((ok, seconds))
+                    self._set_state("closed")
+                else:
+                    self._open()
+            elif self.state == "closed" and not ok and self._should_open():
+                self._open()
+
+    def _should_open(self):
+        if self._consecutive_failures >= self.failures_threshold:
+            return True
+        calls = len(self._outcomes)
+        failed = sum(1 for ok, _ in self._outcomes if not ok)
+        return calls >= self.min_calls and failed / calls >= self.error_rate_threshold
+
+    def _open(self):
+        self._opened_at = time.monotonic()
+        self._set_state("open")
+        print(f"[Job Scraper] {self.name} circuit opened; retrying in {self.cooldown:g}s")
+
+    def _set_state(self, state):
+        self.state = state
+        JOB_SOURCE_CIRCUIT_STATE.set(self.STATES[state], self.name)
+
+    def p95(self):
+        """95th percentile latency of recent successful calls, or None if too few."""
+        with self._lock:
+            latencies = sorted(seconds for ok, seconds in self._outcomes if ok)
+        if len(latencies) < self.min_calls:
+            return None
+        return latencies[min(len(latencies) - 1, int(len(latencies) * 0.95))]
+
+    def adaptive_timeout(self, ceiling):
+        """p95 x multiplier, kept within [ADAPTIVE_TIMEOUT_MIN, ceiling]."""
+        p95 = self.p95()
+        if p95 is None:
+            return ceiling
+        return min(ceiling, max(ADAPTIVE_TIMEOUT_MIN, p95 * ADAPTIVE_TIMEOUT_MULTIPLIER))
+
+    def snapshot(self):
+        with self._lock:
+            calls = len(self._outcomes)
+            failed = sum(1 for ok, _ in self._outcomes if not ok)
+            state = self.state
+        p95 = self.p95()
+        return {
+            "state": state,
+            "window_calls": calls,
+            "error_rate": round(failed / calls, 3) if calls else 0.0,
+            "p95_seconds": round(p95, 3) if p95 is not None else None,
+        }
+
+
+class JobSource:
+    """
+    A pluggable job source for search_jobs.
+
+    fetch(skills, target_role, location, max_results=, score=) returns job
+    dicts. Sources are merged in ascending priority. Each source has its
+    own executor of `concurrency` threads, so a slow or saturated source
+    only queues its own fetches; stragglers finish in the background.
+    search_jobs waits at most `timeout` seconds for a source, and it
+    contributes at most `budget` results per search. `enabled` may be a
+    bool or a zero-argument callable.
+
+    Every call goes through the source's CircuitBreaker, and the effective
+    timeout shrinks to the observed p95 latency once enough calls succeed.
+    """
+
+    def __init__(self, name, fetch, priority=100, concurrency=4, timeout=SEARCH_DEADLINE,
+                 budget=10, enabled=True):
+        self.name = name
+        self.fetch = fetch
+        self.priority = _source_setting(name, "PRIORITY", priority)
+        self.concurrency = _source_setting(name, "CONCURRENCY", concurrency)
+        self.timeout = _source_setting(name, "TIMEOUT", float(timeout))
+        self.budget = _source_setting(name, "BUDGET", budget)
+        self._enabled = enabled
+        # Also bounds direct run() calls, e.g. from the prefetcher thread
+        self._slots = threading.BoundedSemaphore(self.concurrency)
+        self.executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix=f"job-source-{name}")
+        self.breaker = CircuitBreaker(name)
+
+    @property
+    def enabled(self):
+        return self._enabled() if callable(self._enabled) else bool(self._enabled)
+
+    def limit(self, max_results):
+        """Results to request from this source for a search of max_results."""
+        return min(self.budget, max_results)
+
+    def current_timeout(self):
+        """Seconds to wait for this source: adaptive, capped at `timeout`."""
+        return self.breaker.adaptive_timeout(self.timeout)
+
+    def available(self):
+        """False while the circuit is open (or a half-open probe is running)."""
+        return not self.breaker.is_open()
+
+    def run(self, skills, target_role, location, max_results, score):
+        """
+        Fetch under this source's concurrency limit and circuit breaker.
+        The breaker is consulted only once a slot is held, so a call that is
+        queued and then cancelled never holds the half-open probe.
+        """
+        timeout = self.current_timeout()
+        if not self._slots.acquire(timeout=timeout):
+            raise SourceUnavailable(f"{self.name} concurrency limit ({self.concurrency}) saturated")
+        if not self.breaker.allow():
+            self._slots.release()
+            raise SourceUnavailable(f"{self.name} circuit is open")
+
+        _call_state.error = None
+        _call_state.read_timeout = min(timeout, HTTP_READ_TIMEOUT)
+        start = time.monotonic()
+        _call_state.deadline = start + timeout
+        try:
+            results = self.fetch(skills, target_role, location, max_results=max_results, score=score)
+        except Exception:
+            self.breaker.record(False, time.monotonic() - start)
+            raise
+        else:
+            self.breaker.record(_call_state.error is None, time.monotonic() - start)
+            return results
+        finally:
+            _call_state.read_timeout = None
+            _call_state.deadline = None
+            self._slots.release()
+
+    def status(self):
+        return {
+            "priority": self.priority,
+            "concurrency": self.concurrency,
+            "budget": self.budget,
+            "timeout_seconds": self.timeout,
+            "current_timeout_seconds": round(self.current_timeout(), 3),
+            **self.breaker.snapshot(),
+        }
+
+
+JOB_SOURCES = {}
+
+
+def register_source(source):
+    """Add or replace a job source in the registry."""
+    JOB_SOURCES[source.name] = source
+    return source
+
+
+def job_sources():
+    """Enabled sources in priority order."""
+    return sorted((s for s in JOB_SOURCES.values() if s.enabled), key=lambda s: s.priority)
+
+
+def source_status():
+    """Limits, circuit state, error rate and timeouts per enabled source."""
+    return {source.name: source.status() for source in job_sources()}
+
+
+register_source(JobSource("LinkedIn", scrape_linkedin_jobs, priority=10, concurrency=4))
+register_source(JobSource(
+    "Adzuna", fetch_adzuna_jobs, priority=20, concurrency=8,
+    enabled=lambda: bool(ADZUNA_APP_ID and ADZUNA_APP_KEY),
+))
+register_source(JobSource(
+    "Fixture", fetch_fixture_jobs, priority=30, concurrency=16, timeout=1,
+    enabled=lambda: bool(JOB_FIXTURE_FILE),
+))
+
+
+# Job Results Cache
+
+class JobCache:
+    """
+    Thread-safe TTL + LRU cache for per-source job results.
+
+    Keys are (normalized query, location, source, max_results). Entries are
+    fresh for `ttl` seconds, then stale for `stale_ttl` more seconds, after
+    which they expire. The least recently used entry is evicted once
+    `max_entries` is exceeded.
+    """
+
+    def __init__(self, ttl=JOB_CACHE_TTL, stale_ttl=JOB_CACHE_STALE, max_entries=JOB_CACHE_SIZE):
+        self.ttl = ttl
+        self.stale_ttl = stale_ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._refreshing = set()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        """Return (results, state) where state is "fresh", "stale" or None."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None, None
+            stored_at, results = entry
+            age = time.time() - stored_at
+            if age > self.ttl + self.stale_ttl:
+                del self._entries[key]
+                return None, None
+            self._entries.move_to_end(key)
+            state = "fresh" if age <= self.ttl else "stale"
+            return [dict(job) for job in results], state
+
+    def set(self, key, results):
+        """Store a copy of results and evict least recently used entries."""
+        with self._lock:
+            self._entries[key] = (time.time(), [dict(job) for job in results])
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def begin_refresh(self, key):
+        """Claim a key for background refresh; False if one is already running."""
+        with self._lock:
+            if key in self._refreshing:
+                return False
+            self._refreshing.add(key)
+            return True
+
+    def end_refresh(self, key):
+        with self._lock:
+            self._refreshing.discard(key)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+JOB_CACHE = JobCache()
+
+
+def _cache_key(target_role, skills, score, location, source, max_results):
+    """Cache key built from the normalized tier-adjusted search query."""
+    query = " ".join(_build_search_query(target_role, skills, score).lower().split())
+    return (query, location.lower().strip(), source, max_results)
+
+
+def _fetch_and_cache(key, source, skills, target_role, location, max_results, score):
+    """Run one source fetch and cache non-empty results under key."""
+    with JOB_SOURCES_IN_FLIGHT.track(source.name), JOB_SOURCE_SECONDS.time(source.name):
+        results = source.run(skills, target_role, location, max_results, score)
+    if results:
+        JOB_CACHE.set(key, results)
+    return results
+
+
+def _refresh_in_background(key, source, skills, target_role, location, max_results, score):
+    """Revalidate a stale cache entry without blocking the caller."""
+    if not JOB_CACHE.begin_refresh(key):
+        return
+    if not source.available():
+        JOB_CACHE.end_refresh(key)
+        return
+
+    def _run():
+        try:
+            _fetch_and_cache(key, source, skills, target_role, location, max_results, score)
+        except SourceUnavailable:
+            pass
+        except Exception as e:
+            print(f"[Job Scraper] Background refresh failed for {source.name}: {e}")
+        finally:
+            JOB_CACHE.end_refresh(key)
+
+    source.executor.submit(_run)
+
+
 def search_jobs(skills, target_role="", location="India", max_results=5, score=50):
     """
-    Search for jobs across all available sources.
-    Merges results from LinkedIn and Adzuna, deduplicating by company name.
+    Search for jobs across all registered sources.
+    Queries every enabled source concurrently, serving JOB_CACHE hits without
+    a fetch and skipping sources whose circuit is open. Stops waiting once
+    max_results unique companies have arrived, a source's adaptive timeout
+    passes, or SEARCH_DEADLINE is reached. Results are merged in source
+    priority order, deduplicating by company name.
     Results are tailored to the candidate's score tier.
 
     Args:
@@ -270,34 +841,72 @@ def search_jobs(skills, target_role="", location="India", max_results=5, score=5
     if isinstance(skills, str):
         skills = [s.strip() for s in skills.split(",") if s.strip()]
 
+    sources = job_sources()
+    collected = {}
+    futures = {}
+    for source in sources:
+        limit = source.limit(max_results)
+        key = _cache_key(target_role, skills, score, location, source.name, limit)
+        results, state = JOB_CACHE.get(key)
+        CACHE_REQUESTS.inc("jobs", state or "miss")
+        if state is not None:
+            collected[source.name] = results
+            if state == "stale":
+                _refresh_in_background(key, source, skills, target_role, location, limit, score)
+            continue
+        if not source.available():
+            # Circuit open: skip without waiting; callers fall back to
+            # default companies if nothing else arrives
+            continue
+        future = source.executor.submit(
+            _fetch_and_cache, key, source, skills, target_role, location, limit, score
+        )
+        futures[future] = source
+
+    companies = {job["company"].lower() for results in collected.values() for job in results}
+    deadlines = {future: min(source.current_timeout(), SEARCH_DEADLINE) for future, source in futures.items()}
+    start = time.monotonic()
+    pending = set(futures)
+
+    while pending and len(companies) < max_results:
+        elapsed = time.monotonic() - start
+        for future in [f for f in pending if elapsed >= deadlines[f]]:
+            pending.discard(future)
+            future.cancel()
+            name = futures[future].name
+            print(f"[Job Scraper] {name} source missed its {deadlines[future]:g}s deadline")
+            JOB_SOURCE_DEADLINE_MISSES.inc(name)
+        if not pending:
+            break
+
+        timeout = min(deadlines[f] for f in pending) - elapsed
+        done, pending = wait(pending, timeout=timeout, return_when=FIRST_COMPLETED)
+        for future in done:
+            name = futures[future].name
+            try:
+                collected[name] = future.result()
+            except SourceUnavailable as e:
+                # Another call took the half-open probe, or the source is saturated
+                print(f"[Job Scraper] {name} source skipped: {e}")
+                JOB_SOURCE_ERRORS.inc(name, "unavailable")
+                continue
+            except Exception as e:
+                print(f"[Job Scraper] {name} source failed: {e}")
+                JOB_SOURCE_ERRORS.inc(name, "error")
+                continue
+            companies.update(job["company"].lower() for job in collected[name])
+
+    # Enough results: stop waiting on the rest (running fetches still fill the cache)
+    for future in pending:
+        future.cancel()
+
     all_results = []
     seen_companies = set()
 
-    # Source 1: LinkedIn (score-adjusted query)
-    try:
-        linkedin_results = scrape_linkedin_jobs(
-            skills, target_role, location, max_results=max_results, score=score
-        )
-        for job in linkedin_results:
+    for source in sources:
+        for job in collected.get(source.name, [])[:source.limit(max_results)]:
             if job["company"].lower() not in seen_companies:
                 seen_companies.add(job["company"].lower())
                 all_results.append(job)
-    except Exception as e:
-        print(f"[Job Scraper] LinkedIn source failed: {e}")
-
-    # Source 2: Adzuna (if configured, also score-adjusted)
-    if len(all_results) < max_results:
-        try:
-            adzuna_results = fetch_adzuna_jobs(
-                skills, target_role, location,
-                max_results=max_results - len(all_results),
-                score=score
-            )
-            for job in adzuna_results:
-                if job["company"].lower() not in seen_companies:
-                    seen_companies.add(job["company"].lower())
-                    all_results.append(job)
-        except Exception as e:
-            print(f"[Job Scraper] Adzuna source failed: {e}")
 
     return all_results[:max_results]
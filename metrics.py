@@ -0,0 +1,254 @@
+"""
+Metrics for CarrierIQ.
+Minimal in-process counters, gauges and histograms rendered in the
+Prometheus text exposition format for the /metrics endpoint.
+
+Set METRICS_ENABLED=0 to turn every record call into an early return.
+"""
+
+import os
+import time
+import threading
+from bisect import bisect_left
+from contextlib import nullcontext
+
+METRICS_ENABLED = os.getenv("METRICS_ENABLED", "1").lower() not in ("0", "false", "no", "")
+
+# Seconds; covers sub-millisecond cache hits up to slow scrapes
+DEFAULT_BUCKETS = (0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+_NULL_CONTEXT = nullcontext()
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names, values, extra=""):
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value):
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+# ── Metric Types ────────────────────────────────────────────────────────────
+
+class _Metric:
+    kind = ""
+
+    def __init__(self, name, help_text, labelnames=()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._values = {}
+        self._lock = threading.Lock()
+        REGISTRY.register(self)
+
+    def _header(self):
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Metric):
+    """Monotonically increasing count, one series per label-value tuple."""
+
+    kind = "counter"
+
+    def inc(self, *labelvalues, amount=1):
+        if not METRICS_ENABLED:
+            return
+        with self._lock:
+            self._values[labelvalues] = self._values.get(labelvalues, 0) + amount
+
+    def value(self, *labelvalues):
+        with self._lock:
+            return self._values.get(labelvalues, 0)
+
+    def render(self):
+        lines = self._header()
+        with self._lock:
+            for labelvalues, value in sorted(self._values.items()):
+                lines.append(f"{self.name}{_format_labels(self.labelnames, labelvalues)} {_format_value(value)}")
+        return lines
+
+
+class Gauge(Counter):
+    """Value that goes up and down, e.g. requests in flight."""
+
+    kind = "gauge"
+
+    def dec(self, *labelvalues, amount=1):
+        self.inc(*labelvalues, amount=-amount)
+
+    def set(self, value, *labelvalues):
+        if not METRICS_ENABLED:
+            return
+        with self._lock:
+            self._values[labelvalues] = value
+
+    def track(self, *labelvalues):
+        """Context manager: +1 on entry, -1 on exit."""
+        if not METRICS_ENABLED:
+            return _NULL_CONTEXT
+        return _InFlight(self, labelvalues)
+
+
+class Histogram(_Metric):
+    """Cumulative-bucket histogram of observed values (seconds by default)."""
+
+    kind = "histogram"
+
+    def __init__(self, name, help_text, labelnames=(), buckets=DEFAULT_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value, *labelvalues):
+        if not METRICS_ENABLED:
+            return
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._values.get(labelvalues)
+            if series is None:
+                # per-bucket counts (last slot is +Inf), sum
+                series = self._values[labelvalues] = [[0] * (len(self.buckets) + 1), 0.0]
+            series[0][index] += 1
+            series[1] += value
+
+    def time(self, *labelvalues):
+        """Context manager observing the wall-clock duration of its block."""
+        if not METRICS_ENABLED:
+            return _NULL_CONTEXT
+        return _Timer(self, labelvalues)
+
+    def count(self, *labelvalues):
+        with self._lock:
+            series = self._values.get(labelvalues)
+            return sum(series[0]) if series else 0
+
+    def render(self):
+        lines = self._header()
+        with self._lock:
+            snapshot = [(k, list(v[0]), v[1]) for k, v in sorted(self._values.items())]
+        for labelvalues, counts, total in snapshot:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                labels = _format_labels(self.labelnames, labelvalues, f'le="{_format_value(bound)}"')
+                lines.append(f"{self.name}_bucket{labels} {cumulative}")
+            labels = _format_labels(self.labelnames, labelvalues)
+            lines.append(f"{self.name}_sum{labels} {_format_value(total)}")
+            lines.append(f"{self.name}_count{labels} {cumulative}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("histogram", "labelvalues", "start")
+
+    def __init__(self, histogram, labelvalues):
+        self.histogram = histogram
+        self.labelvalues = labelvalues
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, *self.labelvalues)
+        return False
+
+
+class _InFlight:
+    __slots__ = ("gauge", "labelvalues")
+
+    def __init__(self, gauge, labelvalues):
+        self.gauge = gauge
+        self.labelvalues = labelvalues
+
+    def __enter__(self):
+        self.gauge.inc(*self.labelvalues)
+        return self
+
+    def __exit__(self, *exc):
+        self.gauge.dec(*self.labelvalues)
+        return False
+
+
+# ── Registry ────────────────────────────────────────────────────────────────
+
+class Registry:
+    """Holds every metric and renders them for scraping."""
+
+    def __init__(self):
+        self._metrics = []
+        self._lock = threading.Lock()
+
+    def register(self, metric):
+        with self._lock:
+            self._metrics.append(metric)
+
+    def render(self):
+        with self._lock:
+            metrics = list(self._metrics)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+# ── CarrierIQ Metrics ───────────────────────────────────────────────────────
+
+STAGE_SECONDS = Histogram(
+    "carrieriq_analysis_stage_seconds",
+    "Latency of each analysis pipeline stage.",
+    ("pipeline", "stage"),
+)
+ANALYSES_IN_FLIGHT = Gauge(
+    "carrieriq_analyses_in_flight",
+    "Analyses currently running.",
+    ("pipeline",),
+)
+CACHE_REQUESTS = Counter(
+    "carrieriq_cache_requests_total",
+    "Cache lookups by cache and result (hit, stale, miss, not_modified).",
+    ("cache", "result"),
+)
+JOB_SOURCE_SECONDS = Histogram(
+    "carrieriq_job_source_seconds",
+    "Latency of one fetch from a job source.",
+    ("source",),
+)
+JOB_SOURCES_IN_FLIGHT = Gauge(
+    "carrieriq_job_sources_in_flight",
+    "Job source fetches currently running.",
+    ("source",),
+)
+JOB_SOURCE_ERRORS = Counter(
+    "carrieriq_job_source_errors_total",
+    "Failed job source fetches by reason (status, timeout, error, unavailable).",
+    ("source", "reason"),
+)
+JOB_SOURCE_DEADLINE_MISSES = Counter(
+    "carrieriq_job_source_deadline_misses_total",
+    "Job source fetches dropped for missing the search deadline.",
+    ("source",),
+)
+JOB_SOURCE_CIRCUIT_STATE = Gauge(
+    "carrieriq_job_source_circuit_state",
+    "Circuit breaker state per job source (0 closed, 1 half-open, 2 open).",
+    ("source",),
+)
+
+
+def render():
+    """All metrics in Prometheus text format."""
+    return REGISTRY.render()
@@ -0,0 +1,141 @@
+"""
+Request Profiler for CarrierIQ.
+Opt-in sampling profiler for slow requests. While enabled, one background
+thread samples the stacks of in-flight request threads (and busy job-source
+workers, where LinkedIn/Adzuna parsing runs) every few milliseconds. The
+samples are only written out when a request exceeds the latency threshold
+or carries the profile header, as a collapsed-stack file ready for
+flamegraph.pl or speedscope.
+
+Each saved profile is also appended to profiles/index.jsonl with its route,
+resume size, role and latency tags.
+"""
+
+import os
+import re
+import sys
+import json
+import time
+import threading
+from collections import Counter
+
+REQUEST_PROFILER = os.getenv("REQUEST_PROFILER", "0").lower() in ("1", "true", "yes")
+PROFILE_THRESHOLD_MS = float(os.getenv("PROFILE_THRESHOLD_MS", "2000"))
+PROFILE_HEADER = os.getenv("PROFILE_HEADER", "X-CarrierIQ-Profile")
+PROFILE_INTERVAL_MS = float(os.getenv("PROFILE_INTERVAL_MS", "5"))
+PROFILE_DIR = os.getenv("PROFILE_DIR", "profiles")
+
+# Worker threads whose busy stacks are attributed to the profiled requests.
+# With concurrent requests these samples may include another request's work.
+WORKER_THREAD_PREFIXES = ("job-source",)
+
+MAX_STACK_DEPTH = 128
+
+
+def _frame_label(code):
+    return f"{code.co_name} ({os.path.basename(code.co_filename)})"
+
+
+def _collapse(frame):
+    """Root-first 'a;b;c' stack for a frame, cut at MAX_STACK_DEPTH."""
+    labels = []
+    while frame is not None and len(labels) < MAX_STACK_DEPTH:
+        labels.append(_frame_label(frame.f_code))
+        frame = frame.f_back
+    return ";".join(reversed(labels))
+
+
+class _Session:
+    """Samples collected for one request thread."""
+
+    def __init__(self, thread_id):
+        self.thread_id = thread_id
+        self.started = time.perf_counter()
+        self.stacks = Counter()
+        self.tags = {}
+
+
+class RequestProfiler:
+    """
+    One sampler thread shared by every profiled request.
+
+    start() registers the calling request thread; stop() unregisters it and
+    returns its session. The sampler only runs while sessions are active.
+    """
+
+    def __init__(self, interval=PROFILE_INTERVAL_MS / 1000, directory=PROFILE_DIR):
+        self.interval = interval
+        self.directory = directory
+        self._sessions = {}
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._thread = None
+
+    def start(self):
+        session = _Session(threading.get_ident())
+        with self._lock:
+            self._sessions[session.thread_id] = session
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="request-profiler", daemon=True)
+                self._thread.start()
+        self._wake.set()
+        return session
+
+    def stop(self, session):
+        with self._lock:
+            self._sessions.pop(session.thread_id, None)
+        return session
+
+    def _run(self):
+        while True:
+            self._wake.wait()
+            with self._lock:
+                sessions = list(self._sessions.values())
+                if not sessions:
+                    self._wake.clear()
+                    continue
+            self._sample(sessions)
+            time.sleep(self.interval)
+
+    def _sample(self, sessions):
+        frames = sys._current_frames()
+        workers = []
+        for thread in threading.enumerate():
+            if thread.name.startswith(WORKER_THREAD_PREFIXES) and thread.ident in frames:
+                frame = frames[thread.ident]
+                # Idle pool threads sit in the executor's _worker loop
+                if frame.f_code.co_name != "_worker":
+                    workers.append(f"[{thread.name}];{_collapse(frame)}")
+
+        for session in sessions:
+            frame = frames.get(session.thread_id)
+            if frame is not None:
+                session.stacks[_collapse(frame)] += 1
+            for stack in workers:
+                session.stacks[stack] += 1
+
+    def save(self, session, elapsed_ms, **tags):
+        """Write the session's collapsed stacks and index entry; returns the path."""
+        os.makedirs(self.directory, exist_ok=True)
+        route = re.sub(r"[^A-Za-z0-9]+", "_", tags.get("route", "")).strip("_") or "root"
+        name = f"{time.strftime('%Y%m%d-%H%M%S')}_{route}_{session.thread_id % 100000}_{int(elapsed_ms)}ms.collapsed"
+        path = os.path.join(self.directory, name)
+
+        with open(path, "w", encoding="utf-8") as f:
+            for stack, count in session.stacks.most_common():
+                f.write(f"{stack} {count}\n")
+
+        entry = {
+            "file": name,
+            "elapsed_ms": round(elapsed_ms, 1),
+            "samples": sum(session.stacks.values()),
+            "interval_ms": self.interval * 1000,
+            **tags,
+        }
+        with open(os.path.join(self.directory, "index.jsonl"), "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        print(f"[Profiler] Saved {entry['samples']} samples for {tags.get('route', '')} ({elapsed_ms:.0f}ms) -> {path}")
+        return path
+
+
+PROFILER = RequestProfiler() if REQUEST_PROFILER else None
@@ -0,0 +1,126 @@
+"""
+Analysis Result Store for CarrierIQ.
+Keeps analysis results server-side so the cookie session only carries an
+analysis ID. Results live in an in-process LRU with TTL expiry, optionally
+backed by SQLite so they survive restarts and are shared across workers.
+"""
+
+import os
+import json
+import time
+import uuid
+import sqlite3
+import threading
+from collections import OrderedDict
+
+RESULT_STORE_TTL = float(os.getenv("RESULT_STORE_TTL", "3600"))
+RESULT_STORE_SIZE = int(os.getenv("RESULT_STORE_SIZE", "1000"))
+# SQLite file backing the in-process LRU ("" keeps results in memory only)
+RESULT_STORE_DB = os.getenv("RESULT_STORE_DB", "")
+
+# Purge expired SQLite rows once every this many writes
+_PURGE_EVERY = 100
+
+
+class ResultStore:
+    """
+    Thread-safe TTL + LRU store of JSON-serializable results keyed by ID.
+
+    Entries expire `ttl` seconds after they are stored; the least recently
+    used entry is evicted from memory once `max_entries` is exceeded. With
+    `db_path`, every result is also written to SQLite and memory misses fall
+    back to it.
+    """
+
+    def __init__(self, ttl=RESULT_STORE_TTL, max_entries=RESULT_STORE_SIZE, db_path=RESULT_STORE_DB):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = self._open_db(db_path) if db_path else None
+        self._writes = 0
+
+    def _open_db(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        db = sqlite3.connect(path, check_same_thread=False)
+        db.execute("PRAGMA journal_mode=WAL")
+        db.execute(
+            "CREATE TABLE IF NOT EXISTS results ("
+            "id TEXT PRIMARY KEY, expires_at REAL NOT NULL, payload TEXT NOT NULL)"
+        )
+        db.commit()
+        return db
+
+    def put(self, value):
+        """Store value under a new ID and return the ID."""
+        result_id = uuid.uuid4().hex
+        expires_at = time.time() + self.ttl
+        with self._lock:
+            self._remember(result_id, expires_at, value)
+            if self._db is not None:
+                self._write_db(result_id, expires_at, value)
+        return result_id
+
+    def get(self, result_id):
+        """The stored value, or None if unknown or expired."""
+        if not result_id:
+            return None
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(result_id)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at >= now:
+                    self._entries.move_to_end(result_id)
+                    return value
+                del self._entries[result_id]
+                return None
+
+            if self._db is None:
+                return None
+            row = self._db.execute(
+                "SELECT expires_at, payload FROM results WHERE id = ? AND expires_at >= ?",
+                (result_id, now),
+            ).fetchone()
+            if row is None:
+                return None
+            value = json.loads(row[1])
+            self._remember(result_id, row[0], value)
+            return value
+
+    def _remember(self, result_id, expires_at, value):
+        """Insert into the in-memory LRU. Caller holds _lock."""
+        self._entries[result_id] = (expires_at, value)
+        self._entries.move_to_end(result_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _write_db(self, result_id, expires_at, value):
+        """Persist one result, purging expired rows periodically. Caller holds _lock."""
+        try:
+            self._db.execute(
+                "INSERT OR REPLACE INTO results (id, expires_at, payload) VALUES (?, ?, ?)",
+                (result_id, expires_at, json.dumps(value)),
+            )
+            self._writes += 1
+            if self._writes % _PURGE_EVERY == 0:
+                self._db.execute("DELETE FROM results WHERE expires_at < ?", (time.time(),))
+            self._db.commit()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"[Result Store] SQLite write failed: {e}")
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+
+RESULT_STORE = ResultStore()
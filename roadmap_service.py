@@ -0,0 +1,83 @@
+"""
+Roadmap Service for CarrierIQ.
+Memoizes learning roadmaps per (role, missing core/important/nice skills) so
+visitors with the same skill gaps share one build, and precomputes every
+role's "everything missing" roadmap at startup.
+"""
+
+import os
+from functools import lru_cache
+
+from skill_scorer import ROLE_SKILLS
+from learning_resources import build_learning_roadmap
+
+ROADMAP_CACHE_SIZE = int(os.getenv("ROADMAP_CACHE_SIZE", "1024"))
+
+# role -> {skill: position} across core, important and nice, in database order
+_ROLE_SKILL_ORDER = {
+    role: {
+        skill: position
+        for position, skill in enumerate(data["core"] + data["important"] + data["nice"])
+    }
+    for role, data in ROLE_SKILLS.items()
+}
+
+
+def _canonical_skills(skills, order):
+    """
+    Deduplicate skills case-insensitively and fix their order: the role's
+    own skills first in database order (title-cased, as the results page
+    sends them), then any others alphabetically.
+    """
+    names = {}
+    for skill in skills:
+        skill = skill.strip()
+        lowered = skill.lower()
+        if lowered and lowered not in names:
+            names[lowered] = skill.title() if lowered in order else skill
+
+    known = sorted((s for s in names if s in order), key=order.get)
+    unknown = sorted(s for s in names if s not in order)
+    return tuple(names[s] for s in known + unknown)
+
+
+def roadmap_key(role, missing_core=(), missing_important=(), missing_nice=()):
+    """
+    Canonical (role, core, important, nice) key for a roadmap request.
+    With no missing skills given, a known role gets all of its skills.
+    """
+    role_key = role.lower().strip()
+    if not (missing_core or missing_important or missing_nice) and role_key in ROLE_SKILLS:
+        data = ROLE_SKILLS[role_key]
+        missing_core, missing_important, missing_nice = data["core"], data["important"], data["nice"]
+
+    order = _ROLE_SKILL_ORDER.get(role_key, {})
+    return (
+        role_key,
+        _canonical_skills(missing_core, order),
+        _canonical_skills(missing_important, order),
+        _canonical_skills(missing_nice, order),
+    )
+
+
+@lru_cache(maxsize=ROADMAP_CACHE_SIZE)
+def get_roadmap(key):
+    """
+    Roadmap phases for a key from roadmap_key(). The result is shared
+    between requests, so callers must treat it as read-only.
+    """
+    _, core, important, nice = key
+    return build_learning_roadmap(list(core), list(important), list(nice))
+
+
+def precompute_roadmaps(render=None):
+    """
+    Build (and optionally render, via render(key)) the all-missing roadmap
+    for every role. Returns the number of roles warmed.
+    """
+    for role in ROLE_SKILLS:
+        key = roadmap_key(role)
+        get_roadmap(key)
+        if render is not None:
+            render(key)
+    return len(ROLE_SKILLS)
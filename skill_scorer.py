@@ -3,7 +3,13 @@ Local Skill Scoring Engine for CarrierIQ.
 Scores candidate skills against role requirements using fuzzy matching.
 """
 
+import hashlib
+import json
+from collections import Counter, defaultdict, deque
 from difflib import SequenceMatcher
+from functools import lru_cache
+
+import numpy as np
 
 # Role-Skill Database
 # Each role has skills in 3 tiers: core (3x weight), important (2x), nice (1x)
@@ -266,6 +272,9 @@ ROLE_SKILLS = {
     },
 }
 
+# Changes whenever ROLE_SKILLS changes; keys compiled indexes and cached results
+SKILL_DB_VERSION = hashlib.sha1(json.dumps(ROLE_SKILLS, sort_keys=True).encode("utf-8")).hexdigest()[:12]
+
 # Company Tiers (Fallback)
 COMPANY_TIERS = {
     "high": [
@@ -295,6 +304,38 @@ COMPANY_TIERS = {
 }
 
 
+# Common abbreviations
+_ABBREVIATIONS = {
+    "ml": "machine learning",
+    "dl": "deep learning",
+    "ds": "data structures",
+    "dsa": "data structures",
+    "algo": "algorithms",
+    "js": "javascript",
+    "ts": "typescript",
+    "py": "python",
+    "ai": "artificial intelligence",
+    "nlp": "natural language processing",
+    "cv": "computer vision",
+    "k8s": "kubernetes",
+    "tf": "tensorflow",
+    "aws": "amazon web services",
+    "gcp": "google cloud platform",
+    "oop": "object oriented programming",
+    "ci/cd": "continuous integration",
+    "react.js": "react",
+    "reactjs": "react",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "vue": "vue.js",
+    "vuejs": "vue.js",
+    "express": "express.js",
+    "expressjs": "express.js",
+    "postgres": "postgresql",
+    "mongo": "mongodb",
+}
+
+
 def _normalize(skill):
     """Normalize a skill string for comparison."""
     return skill.lower().strip().replace("-", " ").replace("_", " ")
@@ -315,38 +356,8 @@ def _fuzzy_match(user_skill, required_skill, threshold=0.7):
             return True
 
     # Common abbreviations
-    abbreviations = {
-        "ml": "machine learning",
-        "dl": "deep learning",
-        "ds": "data structures",
-        "dsa": "data structures",
-        "algo": "algorithms",
-        "js": "javascript",
-        "ts": "typescript",
-        "py": "python",
-        "ai": "artificial intelligence",
-        "nlp": "natural language processing",
-        "cv": "computer vision",
-        "k8s": "kubernetes",
-        "tf": "tensorflow",
-        "aws": "amazon web services",
-        "gcp": "google cloud platform",
-        "oop": "object oriented programming",
-        "ci/cd": "continuous integration",
-        "react.js": "react",
-        "reactjs": "react",
-        "node": "node.js",
-        "nodejs": "node.js",
-        "vue": "vue.js",
-        "vuejs": "vue.js",
-        "express": "express.js",
-        "expressjs": "express.js",
-        "postgres": "postgresql",
-        "mongo": "mongodb",
-    }
-
-    u_expanded = abbreviations.get(u, u)
-    r_expanded = abbreviations.get(r, r)
+    u_expanded = _ABBREVIATIONS.get(u, u)
+    r_expanded = _ABBREVIATIONS.get(r, r)
 
     if u_expanded == r_expanded:
         return True
@@ -358,6 +369,118 @@ def _fuzzy_match(user_skill, required_skill, threshold=0.7):
     return ratio >= threshold
 
 
+# Compiled Skill Matcher
+# Precomputes lookup tables for a fixed vocabulary so each user skill is
+# resolved once per request instead of once per (user skill x required skill).
+
+class SkillMatcher:
+    """
+    Match user skills against a fixed vocabulary with `_fuzzy_match` semantics.
+
+    `matches(user_skill, threshold)` returns the frozenset of vocabulary
+    entries for which `_fuzzy_match(user_skill, entry, threshold)` is True.
+    Exact, alias and substring hits come from lookup tables; the
+    SequenceMatcher fallback only runs on candidates whose length and
+    character overlap can still reach the threshold.
+    """
+
+    def __init__(self, vocabulary, cache_size=4096):
+        self._vocab = []
+        self._exact = defaultdict(set)
+        self._alias = defaultdict(set)
+        self._substrings = defaultdict(set)
+        self._char_index = defaultdict(list)
+        self._max_len = 0
+
+        for skill in dict.fromkeys(vocabulary):
+            r = _normalize(skill)
+            idx = len(self._vocab)
+            self._vocab.append((skill, r, len(r)))
+            self._exact[r].add(skill)
+            self._alias[_ABBREVIATIONS.get(r, r)].add(skill)
+            if len(r) > 2:
+                self._max_len = max(self._max_len, len(r))
+                for i in range(len(r)):
+                    for j in range(i + 3, len(r) + 1):
+                        self._substrings[r[i:j]].add(skill)
+            for ch, count in Counter(r).items():
+                self._char_index[ch].append((idx, count))
+
+        self._lookup = lru_cache(maxsize=cache_size)(self._compute)
+
+    def matches(self, user_skill, threshold=0.7):
+        """Return the vocabulary entries that fuzzy-match `user_skill`."""
+        return self._lookup(_normalize(user_skill), threshold)
+
+    def _compute(self, u, threshold):
+        if threshold <= 0:
+            return frozenset(skill for skill, _, _ in self._vocab)
+
+        found = set(self._exact.get(u, ()))
+
+        # Substring match: u inside r, or r inside u (both longer than 2 chars)
+        if len(u) > 2:
+            found.update(self._substrings.get(u, ()))
+            for i in range(len(u)):
+                for j in range(i + 3, min(i + self._max_len, len(u)) + 1):
+                    found.update(self._exact.get(u[i:j], ()))
+
+        # Abbreviation match
+        u_expanded = _ABBREVIATIONS.get(u, u)
+        found.update(self._alias.get(u_expanded, ()))
+        found.update(self._exact.get(u_expanded, ()))
+        found.update(self._alias.get(u, ()))
+
+        # Fuzzy fallback: character overlap bounds the SequenceMatcher ratio
+        overlap = defaultdict(int)
+        for ch, count in Counter(u).items():
+            for idx, r_count in self._char_index.get(ch, ()):
+                overlap[idx] += min(count, r_count)
+
+        u_len = len(u)
+        for idx, common in overlap.items():
+            skill, r, r_len = self._vocab[idx]
+            if skill in found:
+                continue
+            if 2.0 * common / (u_len + r_len) < threshold:
+                continue
+            if SequenceMatcher(None, u, r).ratio() >= threshold:
+                found.add(skill)
+
+        return frozenset(found)
+
+
+def _all_role_skills():
+    """Every required skill across all roles, in database order."""
+    return [
+        skill
+        for role_data in ROLE_SKILLS.values()
+        for category in ["core", "important", "nice"]
+        for skill in role_data[category]
+    ]
+
+
+SKILL_MATCHER = SkillMatcher(_all_role_skills())
+ROLE_MATCHER = SkillMatcher(ROLE_SKILLS)
+
+
+def _match_role_name(role_key, threshold=0.6):
+    """Return the first role (in database order) whose name fuzzy-matches role_key."""
+    candidates = ROLE_MATCHER.matches(role_key, threshold)
+    for r in ROLE_SKILLS:
+        if r in candidates:
+            return r
+    return None
+
+
+def _matched_skill_set(user_skills):
+    """Union of every required skill matched by any of the user's skills."""
+    matched = set()
+    for us in user_skills:
+        matched |= SKILL_MATCHER.matches(us)
+    return matched
+
+
 def _parse_skills(skills_input):
     """Parse skills from a comma-separated string or list."""
     if isinstance(skills_input, list):
@@ -370,14 +493,11 @@ def _find_best_role(user_skills):
     best_role = None
     best_score = -1
 
+    user_matches = [SKILL_MATCHER.matches(us) for us in user_skills]
+
     for role, categories in ROLE_SKILLS.items():
-        all_skills = categories["core"] + categories["important"] + categories["nice"]
-        matches = 0
-        for us in user_skills:
-            for rs in all_skills:
-                if _fuzzy_match(us, rs):
-                    matches += 1
-                    break
+        all_skills = set(categories["core"] + categories["important"] + categories["nice"])
+        matches = sum(1 for m in user_matches if not m.isdisjoint(all_skills))
         if matches > best_score:
             best_score = matches
             best_role = role
@@ -415,14 +535,8 @@ def score_skills(user_skills_input, target_role=""):
     role_key = _normalize(target_role) if target_role else ""
 
     if role_key not in ROLE_SKILLS:
-        # Try fuzzy matching the role name
-        for r in ROLE_SKILLS:
-            if _fuzzy_match(role_key, r, threshold=0.6):
-                role_key = r
-                break
-        else:
-            # Auto-detect best role
-            role_key = _find_best_role(user_skills)
+        # Try fuzzy matching the role name, else auto-detect best role
+        role_key = _match_role_name(role_key) or _find_best_role(user_skills)
 
     if not role_key or role_key not in ROLE_SKILLS:
         role_key = "software engineer"  # safe default
@@ -433,15 +547,13 @@ def score_skills(user_skills_input, target_role=""):
     matched = {"core": [], "important": [], "nice": []}
     missing = {"core": [], "important": [], "nice": []}
 
+    matched_set = _matched_skill_set(user_skills)
+
     for category in ["core", "important", "nice"]:
         for required_skill in role_data[category]:
-            found = False
-            for user_skill in user_skills:
-                if _fuzzy_match(user_skill, required_skill):
-                    matched[category].append(required_skill.title())
-                    found = True
-                    break
-            if not found:
+            if required_skill in matched_set:
+                matched[category].append(required_skill.title())
+            else:
                 missing[category].append(required_skill.title())
 
     # Calculate weighted score
@@ -494,6 +606,114 @@ def score_skills(user_skills_input, target_role=""):
     }
 
 
+# Category labels for each role (roles not listed default to "IT / Software")
+ROLE_CATEGORIES = {
+    "mechanical design engineer": "Mechanical Engineering",
+    "robotics engineer": "Mechanical Engineering",
+    "embedded systems engineer": "Electronics Engineering",
+    "vlsi design engineer": "Electronics Engineering",
+    "iot engineer": "Electronics Engineering",
+    "electrical design engineer": "Electrical Engineering",
+    "structural engineer": "Civil Engineering",
+    "construction manager": "Civil Engineering",
+    "blockchain developer": "IT / Software",
+    "game developer": "IT / Software",
+    "network engineer": "IT / Networking",
+    "database administrator": "IT / Software",
+    "technical writer": "IT / Content",
+    "biomedical engineer": "Biomedical Engineering",
+    "environmental engineer": "Environmental Engineering",
+}
+
+CATEGORY_WEIGHTS = {"core": 3, "important": 2, "nice": 1}
+
+
+# Role x Skill Weight Matrix
+# ROLE_SKILLS compiled into CSR arrays (one row per role, one column per
+# distinct skill) so scoring against every role is a sparse product.
+
+class RoleSkillMatrix:
+    """Sparse role x skill weight matrix (core=3, important=2, nice=1)."""
+
+    def __init__(self, role_skills):
+        self.roles = list(role_skills)
+        self.skills = list(dict.fromkeys(
+            skill
+            for role_data in role_skills.values()
+            for category in CATEGORY_WEIGHTS
+            for skill in role_data[category]
+        ))
+        self.skill_index = {skill: i for i, skill in enumerate(self.skills)}
+
+        indptr, indices, data = [0], [], []
+        for role_data in role_skills.values():
+            for category, weight in CATEGORY_WEIGHTS.items():
+                for skill in role_data[category]:
+                    indices.append(self.skill_index[skill])
+                    data.append(weight)
+            indptr.append(len(indices))
+
+        self.indptr = np.array(indptr, dtype=np.int64)
+        self.indices = np.array(indices, dtype=np.int64)
+        self.data = np.array(data, dtype=np.int64)
+        self.total_weight = self._row_sums(self.data[np.newaxis, :])[0]
+        self.total_count = np.diff(self.indptr)
+
+    def skill_vector(self, matched_skills):
+        """0/1 vector over the skill columns for a set of matched skills."""
+        vec = np.zeros(len(self.skills), dtype=np.int64)
+        cols = [self.skill_index[s] for s in matched_skills if s in self.skill_index]
+        vec[cols] = 1
+        return vec
+
+    def score(self, skill_matrix):
+        """
+        Score N profiles (an N x skills 0/1 matrix) against every role.
+
+        Returns:
+            (earned_weight, matched_count) arrays, each N x roles
+        """
+        hits = skill_matrix[:, self.indices]
+        return self._row_sums(hits * self.data), self._row_sums(hits)
+
+    def _row_sums(self, values):
+        """Sum CSR entries per role for each profile row."""
+        out = np.zeros((values.shape[0], len(self.roles)), dtype=np.int64)
+        nonempty = self.indptr[:-1] < self.indptr[1:]
+        if values.shape[1]:
+            out[:, nonempty] = np.add.reduceat(values, self.indptr[:-1][nonempty], axis=1)
+        return out
+
+
+ROLE_MATRIX = RoleSkillMatrix(ROLE_SKILLS)
+
+
+def _rank_roles(earned, matched):
+    """Turn one row of role scores into the ranked find_best_roles list."""
+    results = []
+
+    for i, role_key in enumerate(ROLE_MATRIX.roles):
+        total_weight = int(ROLE_MATRIX.total_weight[i])
+        total_count = int(ROLE_MATRIX.total_count[i])
+        matched_count = int(matched[i])
+
+        score = round((int(earned[i]) / total_weight) * 100) if total_weight > 0 else 0
+
+        results.append({
+            "role": role_key.title(),
+            "score": score,
+            "matched": matched_count,
+            "total": total_count,
+            "missing": total_count - matched_count,
+            "category": ROLE_CATEGORIES.get(role_key, "IT / Software"),
+        })
+
+    # Sort by score descending, then by role name
+    results.sort(key=lambda x: (-x["score"], x["role"]))
+
+    return results
+
+
 def find_best_roles(user_skills_input):
     """
     Score user skills against ALL roles and return ranked matches.
@@ -505,67 +725,36 @@ def find_best_roles(user_skills_input):
         list of dicts: [{role, score, matched, missing, total, category}, ...]
         sorted by score descending
     """
-    user_skills = _parse_skills(user_skills_input)
-
-    if not user_skills:
-        return []
-
-    # Category labels for each role
-    role_categories = {
-        "mechanical design engineer": "Mechanical Engineering",
-        "robotics engineer": "Mechanical Engineering",
-        "embedded systems engineer": "Electronics Engineering",
-        "vlsi design engineer": "Electronics Engineering",
-        "iot engineer": "Electronics Engineering",
-        "electrical design engineer": "Electrical Engineering",
-        "structural engineer": "Civil Engineering",
-        "construction manager": "Civil Engineering",
-        "blockchain developer": "IT / Software",
-        "game developer": "IT / Software",
-        "network engineer": "IT / Networking",
-        "database administrator": "IT / Software",
-        "technical writer": "IT / Content",
-        "biomedical engineer": "Biomedical Engineering",
-        "environmental engineer": "Environmental Engineering",
-    }
+    return rank_profiles([user_skills_input])[0]
 
-    results = []
 
-    for role_key, role_data in ROLE_SKILLS.items():
-        weights = {"core": 3, "important": 2, "nice": 1}
-        total_weight = 0
-        earned_weight = 0
-        matched_count = 0
-        total_count = 0
+def rank_profiles(profiles):
+    """
+    Rank many candidate profiles against ALL roles in one matrix product.
 
-        for category in ["core", "important", "nice"]:
-            for required_skill in role_data[category]:
-                total_count += 1
-                total_weight += weights[category]
-                for user_skill in user_skills:
-                    if _fuzzy_match(user_skill, required_skill):
-                        earned_weight += weights[category]
-                        matched_count += 1
-                        break
+    Args:
+        profiles: list of skill inputs (comma-separated strings or lists)
 
-        score = round((earned_weight / total_weight) * 100) if total_weight > 0 else 0
+    Returns:
+        list (one per profile) of find_best_roles-style ranked lists;
+        profiles with no skills get an empty list
+    """
+    parsed = [_parse_skills(p) for p in profiles]
+    active = [i for i, skills in enumerate(parsed) if skills]
 
-        # Default category for roles not in the map
-        category = role_categories.get(role_key, "IT / Software")
+    rankings = [[] for _ in parsed]
+    if not active:
+        return rankings
 
-        results.append({
-            "role": role_key.title(),
-            "score": score,
-            "matched": matched_count,
-            "total": total_count,
-            "missing": total_count - matched_count,
-            "category": category,
-        })
+    skill_matrix = np.stack([
+        ROLE_MATRIX.skill_vector(_matched_skill_set(parsed[i])) for i in active
+    ])
+    earned, matched = ROLE_MATRIX.score(skill_matrix)
 
-    # Sort by score descending, then by role name
-    results.sort(key=lambda x: (-x["score"], x["role"]))
+    for row, i in enumerate(active):
+        rankings[i] = _rank_roles(earned[row], matched[row])
 
-    return results
+    return rankings
 
 
 def _generate_suggestions(matched, missing, score, role):
@@ -727,27 +916,99 @@ def calculate_company_eligibility(candidate_score, job_title=""):
     return max(10, min(100, eligibility))
 
 
-def extract_skills_from_text(text):
+# Skill Extraction Automaton
+# Aho-Corasick automaton over every known skill: one linear pass over the
+# text finds all occurrences, then token-boundary checks drop partial words.
+
+class SkillAutomaton:
+    """Multi-pattern matcher that finds every skill occurrence in one pass."""
+
+    def __init__(self, skills):
+        self._goto = [{}]
+        self._fail = [0]
+        self._output = [[]]
+
+        for skill in dict.fromkeys(s.lower() for s in skills):
+            if not skill:
+                continue
+            node = 0
+            for ch in skill:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._output.append([])
+                node = nxt
+            self._output[node].append(skill)
+
+        # Breadth-first failure links; outputs inherit from their fail state
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, nxt in self._goto[node].items():
+                queue.append(nxt)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[nxt] = self._goto[fail].get(ch, 0)
+                self._output[nxt] = self._output[nxt] + self._output[self._fail[nxt]]
+
+    def find_all(self, text):
+        """
+        Yield (skill, start, end) for every token-bounded occurrence in text.
+        Offsets index into the original text; matching is case-insensitive.
+        """
+        goto, fail, output = self._goto, self._fail, self._output
+        node = 0
+        for i, ch in enumerate(text):
+            ch = ch.lower()
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            for skill in output[node]:
+                start = i - len(skill) + 1
+                if _is_token_bounded(text, skill, start, i + 1):
+                    yield skill, start, i + 1
+
+
+def _is_token_bounded(text, skill, start, end):
+    """True if the match is not glued to a neighbouring letter or digit."""
+    if skill[0].isalnum() and start > 0 and text[start - 1].isalnum():
+        return False
+    if skill[-1].isalnum() and end < len(text) and text[end].isalnum():
+        return False
+    return True
+
+
+@lru_cache(maxsize=4)
+def _get_skill_automaton(version):
+    """Build (once per skill-database version) the automaton over all known skills."""
+    return SkillAutomaton(_all_role_skills())
+
+
+def find_skill_occurrences(text):
     """
-    Extract potential skills from resume/profile text by matching
-    against the known skill database.
+    Locate every known skill in resume/profile text in a single pass.
+
+    Returns:
+        dict mapping skill (lowercase) -> {"count": int, "offsets": [(start, end), ...]}
     """
     if not text:
-        return []
-
-    text_lower = text.lower()
-    found_skills = set()
+        return {}
 
-    # Collect all known skills
-    all_skills = set()
-    for role_data in ROLE_SKILLS.values():
-        for category in ["core", "important", "nice"]:
-            all_skills.update(role_data[category])
+    occurrences = {}
+    for skill, start, end in _get_skill_automaton(SKILL_DB_VERSION).find_all(text):
+        entry = occurrences.setdefault(skill, {"count": 0, "offsets": []})
+        entry["count"] += 1
+        entry["offsets"].append((start, end))
+    return occurrences
 
-    for skill in all_skills:
-        # Check if skill appears in the text (word boundary matching)
-        skill_lower = skill.lower()
-        if skill_lower in text_lower:
-            found_skills.add(skill.title())
 
-    return sorted(list(found_skills))
+def extract_skills_from_text(text):
+    """
+    Extract potential skills from resume/profile text by matching
+    against the known skill database (whole-token matches only).
+    """
+    return sorted(skill.title() for skill in find_skill_occurrences(text))
@@ -0,0 +1,28 @@
+"""
+Crash handling in the batch ATS scorer's process pool.
+"""
+
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import batch_ats  # noqa: E402
+
+
+def _crashing_score_file(path, target_role=""):
+    """Stand-in worker: dies outright on crash.pdf, scores everything else."""
+    if os.path.basename(path) == "crash.pdf":
+        os._exit(3)
+    return {"file": path, "ats_score": 50, "ats_grade": "C", "error": "", "seconds": 0.0}
+
+
+def test_crashed_worker_only_fails_its_own_file(monkeypatch):
+    monkeypatch.setattr(batch_ats, "_score_file", _crashing_score_file)
+    paths = [f"f{i}.pdf" for i in range(4)] + ["crash.pdf"] + [f"f{i}.pdf" for i in range(4, 10)]
+
+    records = {r["file"]: r for r in batch_ats.score_paths(paths, workers=4, file_timeout=30)}
+
+    assert sorted(records) == sorted(paths)
+    assert records["crash.pdf"]["error"] == "Worker process crashed"
+    assert all(not records[p]["error"] for p in paths if p != "crash.pdf")
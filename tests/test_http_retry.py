@@ -0,0 +1,72 @@
+"""
+Retry behaviour of the shared job-scraper HTTP session.
+"""
+
+import os
+import sys
+import time
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import job_scraper  # noqa: E402
+from job_scraper import _call_state, _http_get  # noqa: E402
+
+
+class _Handler(BaseHTTPRequestHandler):
+    hits = 0
+
+    def do_GET(self):
+        type(self).hits += 1
+        status = int(self.path.strip("/"))
+        self.send_response(status)
+        self.send_header("Retry-After", "3600")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    _Handler.hits = 0
+    yield f"http://127.0.0.1:{httpd.server_address[1]}"
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def test_429_is_not_retried(server):
+    start = time.monotonic()
+    response = _http_get(f"{server}/429", timeout=(1, 1))
+    assert response.status_code == 429
+    assert _Handler.hits == 1
+    assert time.monotonic() - start < 1
+
+
+def test_retry_after_is_capped(server, monkeypatch):
+    monkeypatch.setattr(job_scraper, "HTTP_RETRY_AFTER_MAX", 0.1)
+    start = time.monotonic()
+    response = _http_get(f"{server}/503", timeout=(1, 1))
+    assert response.status_code == 503
+    assert _Handler.hits == job_scraper.HTTP_RETRIES + 1
+    assert time.monotonic() - start < 1
+
+
+def test_no_retry_past_source_deadline(server, monkeypatch):
+    monkeypatch.setattr(job_scraper, "HTTP_RETRY_AFTER_MAX", 0.5)
+    _call_state.deadline = time.monotonic() + 0.2
+    try:
+        start = time.monotonic()
+        response = _http_get(f"{server}/503", timeout=(1, 1))
+    finally:
+        _call_state.deadline = None
+    assert response.status_code == 503
+    assert _Handler.hits == 1
+    assert time.monotonic() - start < 0.5
@@ -0,0 +1,113 @@
+"""
+Circuit breaker tests for the job source registry.
+"""
+
+import os
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+
+import job_scraper  # noqa: E402
+from job_scraper import JOB_CACHE, JobSource, search_jobs  # noqa: E402
+
+JOB = {"company": "Acme", "title": "Data Scientist", "location": "India", "url": "", "salary": "", "source": "Test"}
+
+
+@pytest.fixture
+def test_source(monkeypatch):
+    """A lone registered source whose breaker is open with no cooldown."""
+    calls = []
+
+    def fetch(skills, target_role, location, max_results=5, score=50):
+        calls.append(target_role)
+        return [JOB]
+
+    source = JobSource("Test", fetch, timeout=0.2)
+    source.calls = calls
+    source.breaker.cooldown = 0
+    source.breaker._open()
+    monkeypatch.setattr(job_scraper, "JOB_SOURCES", {"Test": source})
+    JOB_CACHE.clear()
+    yield source
+    JOB_CACHE.clear()
+
+
+def _fill_executor(source):
+    """Occupy every worker of a source's executor until the returned event is set."""
+    release = threading.Event()
+    started = threading.Barrier(source.concurrency + 1)
+
+    def block():
+        started.wait()
+        release.wait()
+
+    blockers = [source.executor.submit(block) for _ in range(source.concurrency)]
+    started.wait()
+    return release, blockers
+
+
+def test_cancelled_probe_does_not_disable_source(test_source):
+    release, blockers = _fill_executor(test_source)
+    try:
+        # The fetch stays queued behind the blockers and is cancelled at its deadline
+        assert search_jobs(["python"], "Queued", max_results=1) == []
+    finally:
+        release.set()
+        for blocker in blockers:
+            blocker.result()
+
+    assert test_source.calls == []
+    assert not test_source.breaker._probing
+    assert test_source.available()
+
+    # The next search runs the half-open probe, which closes the circuit
+    assert search_jobs(["python"], "Probe", max_results=1) == [JOB]
+    assert test_source.breaker.state == "closed"
+    assert test_source.calls == ["Probe"]
+
+
+def test_half_open_allows_a_single_probe(test_source):
+    breaker = test_source.breaker
+    assert breaker.allow()
+    assert breaker.state == "half_open"
+    assert breaker.is_open()
+    assert not breaker.allow()
+
+    breaker.record(False, 0.1)
+    assert breaker.state == "open"
+    assert breaker.allow()
+    breaker.record(True, 0.1)
+    assert breaker.state == "closed"
+
+
+def test_saturated_source_does_not_block_others(monkeypatch):
+    """A slow source at its concurrency limit must not delay a fast one."""
+    release = threading.Event()
+
+    def slow(skills, target_role, location, max_results=5, score=50):
+        release.wait(5)
+        return []
+
+    def fast(skills, target_role, location, max_results=5, score=50):
+        return [JOB]
+
+    sources = {
+        "Slow": JobSource("Slow", slow, priority=10, concurrency=1, timeout=3),
+        "Fast": JobSource("Fast", fast, priority=20, concurrency=1, timeout=0.5),
+    }
+    monkeypatch.setattr(job_scraper, "JOB_SOURCES", sources)
+    JOB_CACHE.clear()
+    try:
+        with ThreadPoolExecutor(max_workers=16) as searches:
+            results = list(searches.map(
+                lambda i: search_jobs(["python"], f"Role {i}", max_results=1), range(16)
+            ))
+    finally:
+        release.set()
+        JOB_CACHE.clear()
+
+    assert results == [[JOB]] * 16